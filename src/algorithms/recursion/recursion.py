@@ -1,3 +1,4 @@
+import math
 from typing import Any
 
 
@@ -5,6 +6,9 @@ def recursive_sum(arr: list[int | float]) -> int | float:
     """
     Recursively calculates the sum of all numeric elements in a list.
 
+    The list is split in halves by index instead of being sliced, so no
+    element is copied and the recursion depth is O(log n).
+
     Args:
         arr: A list of integers or floats.
 
@@ -17,16 +21,16 @@ def recursive_sum(arr: list[int | float]) -> int | float:
     if not arr:
         return 0
 
-    if not isinstance(arr[0], (int, float)):
-        raise TypeError(f"Expected number, got {type(arr[0]).__name__}.")
-
-    return arr[0] + recursive_sum(arr[1:])
+    return _sum_range(arr, 0, len(arr))
 
 
 def recursive_max(arr: list[int | float]) -> int | float:
     """
     Recursively determines the maximum element in a list.
 
+    The list is split in halves by index instead of being sliced, so no
+    element is copied and the recursion depth is O(log n).
+
     Args:
         arr: A list of integers or floats.
 
@@ -40,35 +44,35 @@ def recursive_max(arr: list[int | float]) -> int | float:
     if not arr:
         raise ValueError("Expected a non-empty list, got an empty list.")
 
-    if not isinstance(arr[0], (int, float)):
-        raise TypeError(f"Expected number, got {type(arr[0]).__name__}.")
-
-    if len(arr) == 1:
-        return arr[0]
-
-    rest_max = recursive_max(arr[1:])
-    return arr[0] if arr[0] > rest_max else rest_max
+    return _max_range(arr, 0, len(arr))
 
 
 def recursive_reverse(arr: list[Any]) -> list[Any]:
     """
     Recursively returns a new list with elements in reverse order.
 
+    The result is preallocated and filled by splitting the index range in
+    halves, so no intermediate lists are built and the recursion depth is
+    O(log n).
+
     Args:
         arr: A list of any elements.
 
     Returns:
         A new list containing the elements in reverse order.
     """
-    if not arr:
-        return []
-
-    return [arr[-1]] + recursive_reverse(arr[:-1])
+    result: list[Any] = [None] * len(arr)
+    if arr:
+        _reverse_range(arr, result, 0, len(arr))
+    return result
 
 
 def factorial(n: int) -> int:
     """
-    Compute the factorial of a number recursively.
+    Compute the factorial of a number.
+
+    The factors are multiplied with math.prod() instead of one recursive
+    call per factor, so large `n` cannot hit the recursion limit.
 
     Args:
         n: Non-negative integer.
@@ -84,15 +88,17 @@ def factorial(n: int) -> int:
         raise TypeError(f"Expected integer, got {type(n).__name__}.")
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers.")
-    if n in (0, 1):
-        return 1
 
-    return n * factorial(n - 1)
+    return math.prod(range(2, n + 1))
 
 
 def fibonacci(n: int) -> int:
     """
-    Compute the n-th Fibonacci number recursively.
+    Compute the n-th Fibonacci number.
+
+    Only the last two numbers of the sequence are kept while iterating, so
+    this takes O(n) additions and no recursion stack, instead of the
+    O(2^n) calls of the two-way recursion.
 
     Args:
         n: Index (non-negative) of the Fibonacci sequence.
@@ -108,12 +114,11 @@ def fibonacci(n: int) -> int:
         raise TypeError(f"Expected integer, got {type(n).__name__}.")
     if n < 0:
         raise ValueError("Fibonacci is not defined for negative numbers.")
-    if n == 0:
-        return 0
-    if n == 1:
-        return 1
 
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 
 def sum_nested_list(arr: list[int | float | list]) -> int | float:
@@ -138,3 +143,42 @@ def sum_nested_list(arr: list[int | float | list]) -> int | float:
         else:
             raise TypeError(f"Unsupported element type: {type(el).__name__}")
     return result
+
+
+# --- Private Helpers ---
+
+def _sum_range(arr: list[int | float], lo: int, hi: int) -> int | float:
+    """Sum the non-empty range arr[lo:hi] by recursive halving."""
+    if hi - lo == 1:
+        value = arr[lo]
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Expected number, got {type(value).__name__}.")
+        return value
+
+    mid = (lo + hi) // 2
+    return _sum_range(arr, lo, mid) + _sum_range(arr, mid, hi)
+
+
+def _max_range(arr: list[int | float], lo: int, hi: int) -> int | float:
+    """Find the maximum of the non-empty range arr[lo:hi] by recursive halving."""
+    if hi - lo == 1:
+        value = arr[lo]
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Expected number, got {type(value).__name__}.")
+        return value
+
+    mid = (lo + hi) // 2
+    left_max = _max_range(arr, lo, mid)
+    right_max = _max_range(arr, mid, hi)
+    return left_max if left_max > right_max else right_max
+
+
+def _reverse_range(arr: list[Any], result: list[Any], lo: int, hi: int) -> None:
+    """Copy the non-empty range arr[lo:hi] to its mirrored slots in `result`."""
+    if hi - lo == 1:
+        result[len(arr) - 1 - lo] = arr[lo]
+        return
+
+    mid = (lo + hi) // 2
+    _reverse_range(arr, result, lo, mid)
+    _reverse_range(arr, result, mid, hi)
@@ -1,4 +1,4 @@
-from typing import TypeVar, Protocol, Any
+from typing import TypeVar, Protocol, Any, Callable, Optional
 
 
 class Comparable(Protocol):
@@ -15,13 +15,15 @@ T = TypeVar("T", bound=Comparable)
 
 # --- Comparison Based Sorting Algorithms ---
 
-def bubble_sort(arr: list[T]) -> None:
+def bubble_sort(arr: list[T], key: Optional[Callable[[T], Any]] = None) -> None:
     """
     Sorts a list in ascending order using the optimized Bubble Sort algorithm.
 
     Bubble Sort repeatedly steps through the list, compares adjacent elements,
     and swaps them if they are in the wrong order. This implementation includes
-    an optimization to stop early if a pass completes without any swaps.
+    an optimization to stop early if a pass completes without any swaps, and
+    each pass stops at the position of the previous pass's last swap, since
+    everything beyond it is already in its final place.
     It is an in-place sorting algorithm.
 
     Complexity:
@@ -32,25 +34,32 @@ def bubble_sort(arr: list[T]) -> None:
     Args:
         arr: A list of elements that supports comparison operations (e.g., int, float).
              The sort is performed in-place.
+        key: Optional function computing a sort key for each element. Keys
+             are computed once and the elements are ordered stably by them.
     """
-    n = len(arr)
-    for i in range(n):
-        swapped = False
-        for j in range(1, n - i):
+    if key is not None:
+        _sort_by_key(bubble_sort, arr, key)
+        return
+
+    bound = len(arr)
+    while bound > 1:
+        last_swap = 0
+        for j in range(1, bound):
             if arr[j] < arr[j - 1]:
                 arr[j], arr[j - 1] = arr[j - 1], arr[j]
-                swapped = True
-        if not swapped:
-            break
+                last_swap = j
+        bound = last_swap
 
 
-def insertion_sort(arr: list[T]) -> None:
+def insertion_sort(arr: list[T], key: Optional[Callable[[T], Any]] = None) -> None:
     """
     Sorts a list in ascending order using the Insertion Sort algorithm.
 
     Insertion Sort builds the final sorted list one item at a time. It iterates
     through the input elements and inserts each element into its correct position
-    in the already-sorted part of the array.
+    in the already-sorted part of the array. Larger elements are shifted one
+    slot to the right and the held element is written once at its final
+    position, instead of being swapped down step by step.
     It is an in-place sorting algorithm.
 
     Complexity:
@@ -61,17 +70,23 @@ def insertion_sort(arr: list[T]) -> None:
     Args:
         arr: A list of elements that supports comparison operations (e.g., int, float).
              The sort is performed in-place.
+        key: Optional function computing a sort key for each element. Keys
+             are computed once and the elements are ordered stably by them.
     """
-    n = len(arr)
-    for i in range(1, n):
-        for j in range(i, 0, -1):
-            if arr[j] < arr[j - 1]:
-                arr[j], arr[j - 1] = arr[j - 1], arr[j]
-            else:
-                break
+    if key is not None:
+        _sort_by_key(insertion_sort, arr, key)
+        return
+
+    for i in range(1, len(arr)):
+        item = arr[i]
+        j = i
+        while j > 0 and item < arr[j - 1]:
+            arr[j] = arr[j - 1]
+            j -= 1
+        arr[j] = item
 
 
-def selection_sort(arr: list[T]) -> None:
+def selection_sort(arr: list[T], key: Optional[Callable[[T], Any]] = None) -> None:
     """
     Sorts a list in ascending order using the Selection Sort algorithm.
 
@@ -89,23 +104,34 @@ def selection_sort(arr: list[T]) -> None:
     Args:
         arr: A list of elements that supports comparison operations (e.g., int, float).
              The sort is performed in-place.
+        key: Optional function computing a sort key for each element. Keys
+             are computed once and the elements are ordered stably by them.
     """
+    if key is not None:
+        _sort_by_key(selection_sort, arr, key)
+        return
+
     n = len(arr)
     for i in range(n):
         min_index = i
+        min_value = arr[i]
         for j in range(i + 1, n):
-            if arr[j] < arr[min_index]:
+            value = arr[j]
+            if value < min_value:
                 min_index = j
-        arr[i], arr[min_index] = arr[min_index], arr[i]
+                min_value = value
+        arr[i], arr[min_index] = min_value, arr[i]
 
 
-def merge_sort(arr: list[T]) -> None:
+def merge_sort(arr: list[T], key: Optional[Callable[[T], Any]] = None) -> None:
     """
     Sorts a list in ascending order using the Merge Sort algorithm (Divide and Conquer).
 
-    Merge Sort is a stable, comparison-based algorithm that recursively divides
-    the list into halves until single-element sublists are obtained. It then
-    merges these sublists in a way that results in a sorted list.
+    Merge Sort is a stable, comparison-based algorithm. This bottom-up version
+    treats every element as a sorted run of width 1 and repeatedly merges
+    adjacent runs in passes of width 1, 2, 4, ... until one run remains, so it
+    needs no recursion. The merges within a pass touch disjoint ranges and are
+    independent of each other.
     The time complexity relies on using O(n) auxiliary space for the merge step.
 
     Complexity:
@@ -117,13 +143,24 @@ def merge_sort(arr: list[T]) -> None:
     Args:
         arr: A list of elements that supports comparison operations (e.g., int, float).
              The sort is performed in-place (with O(n) auxiliary space).
+        key: Optional function computing a sort key for each element. Keys
+             are computed once and the elements are ordered stably by them.
     """
-    if len(arr) <= 1:
+    if key is not None:
+        _sort_by_key(merge_sort, arr, key)
         return
-    _merge_sort_partition(arr, 0, len(arr) - 1)
+
+    n = len(arr)
+    width = 1
+    while width < n:
+        for left in range(0, n - width, 2 * width):
+            mid = left + width - 1
+            right = min(left + 2 * width - 1, n - 1)
+            _merge_sort_helper(arr, left, mid, right)
+        width *= 2
 
 
-def quick_sort(arr: list[T]) -> None:
+def quick_sort(arr: list[T], key: Optional[Callable[[T], Any]] = None) -> None:
     """
     Sorts a list in ascending order using the Quick Sort algorithm (Divide and Conquer).
 
@@ -145,7 +182,13 @@ def quick_sort(arr: list[T]) -> None:
     Args:
         arr: A list of elements that supports comparison operations (e.g., int, float).
              The sort is performed in-place.
+        key: Optional function computing a sort key for each element. Keys
+             are computed once and the elements are ordered stably by them.
     """
+    if key is not None:
+        _sort_by_key(quick_sort, arr, key)
+        return
+
     if len(arr) <= 1:
         return
     _quick_sort_helper(arr, 0, len(arr) - 1)
@@ -184,16 +227,38 @@ def counting_sort(arr: list[int]) -> None:
     for x in arr:
         counts[x] += 1
 
+    # Each run of equal values is written with one slice assignment.
     i = 0
     for val, count in enumerate(counts):
-        while count > 0:
-            arr[i] = val
-            i += 1
-            count -= 1
+        if count:
+            arr[i : i + count] = [val] * count
+            i += count
 
 
 # --- Private Helpers ---
 
+def _sort_by_key(
+    sort_func: Callable[[list[Any]], None],
+    arr: list[T],
+    key: Callable[[T], Any],
+) -> None:
+    """
+    Sort a list in-place by precomputed keys (decorate-sort-undecorate).
+
+    Each element is paired with its key and original index, so `key` runs
+    once per element, the algorithm compares keys only, and ties keep their
+    original order even for unstable algorithms.
+
+    Args:
+        sort_func: The in-place sorting algorithm to run on decorated items.
+        arr: The list to sort.
+        key: Function computing the sort key of an element.
+    """
+    decorated = [(key(value), i, value) for i, value in enumerate(arr)]
+    sort_func(decorated)
+    arr[:] = [value for _, _, value in decorated]
+
+
 def _merge_sort_helper(arr: list[T], left: int, mid: int, right: int) -> None:
     """
     Combines two already sorted sub-arrays into a single sorted sub-array.
@@ -238,29 +303,6 @@ def _merge_sort_helper(arr: list[T], left: int, mid: int, right: int) -> None:
         curr += 1
 
 
-def _merge_sort_partition(arr: list[T], left: int, right: int) -> None:
-    """
-    The recursive core function for the Merge Sort algorithm (Divide step).
-
-    This function recursively divides the array into two halves until the sub-arrays
-    contain at most one element (base case). Once the base case is reached, it
-    calls the _merge function to combine the sorted halves.
-
-    Complexity:
-        - Time: The recursive calls define the O(log n) depth of the algorithm.
-
-    Args:
-        arr: The list being sorted.
-        left: The starting index of the current partition.
-        right: The ending index of the current partition.
-    """
-    if left < right:
-        mid = (left + right) // 2
-        _merge_sort_partition(arr, left, mid)
-        _merge_sort_partition(arr, mid + 1, right)
-        _merge_sort_helper(arr, left, mid, right)
-
-
 def _quick_sort_helper(arr: list[T], left: int, right: int) -> None:
     """
     The recursive core function for the Quick Sort algorithm.
@@ -1,7 +1,6 @@
 from __future__ import annotations
+from collections import deque
 from typing import TypeVar, Generic, Protocol, Any
-from src.data_structures.queues.queue import Queue
-from src.data_structures.stacks.stack import Stack
 
 
 class Comparable(Protocol):
@@ -20,6 +19,7 @@ class Node(Generic[T]):
         value: The data stored in the node.
         neighbors: A set of references to neighboring Node objects.
     """
+    __slots__ = ("value", "neighbors")
     value: T
     neighbors: set[Node[T]]
 
@@ -178,18 +178,18 @@ class Graph(Generic[T]):
 
         visited_order = []
         visited = {start_value}
-        queue: Queue[Node[T]] = Queue()
-        queue.enqueue(self._adj_list[start_value])
+        queue: deque[Node[T]] = deque([self._adj_list[start_value]])
+        enqueue, dequeue = queue.append, queue.popleft
 
-        while not queue.is_empty:
-            current_node = queue.dequeue()
+        while queue:
+            current_node = dequeue()
             visited_order.append(current_node.value)
 
             # Sort neighbors by value for deterministic traversal order
             for neighbor in sorted(current_node.neighbors, key=lambda x: x.value):
                 if neighbor.value not in visited:
                     visited.add(neighbor.value)
-                    queue.enqueue(neighbor)
+                    enqueue(neighbor)
 
         return visited_order
 
@@ -208,11 +208,11 @@ class Graph(Generic[T]):
 
         visited_order = []
         visited = set()
-        stack: Stack[Node[T]] = Stack()
-        stack.push(self._adj_list[start_value])
+        stack = [self._adj_list[start_value]]
+        push, pop = stack.append, stack.pop
 
-        while not stack.is_empty:
-            current_node = stack.pop()
+        while stack:
+            current_node = pop()
 
             if current_node.value not in visited:
                 visited.add(current_node.value)
@@ -227,6 +227,6 @@ class Graph(Generic[T]):
 
                 for neighbor in sorted_neighbors:
                     if neighbor.value not in visited:
-                        stack.push(neighbor)
+                        push(neighbor)
 
         return visited_order
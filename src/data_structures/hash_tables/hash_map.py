@@ -4,25 +4,54 @@ from typing import TypeVar, Generic, Optional, Iterator, Any
 K = TypeVar("K")
 V = TypeVar("V")
 
+MAX_LOAD_FACTOR = 0.7
+
+# Slot markers: a never-used slot ends a probe sequence, a deleted one does not.
+_EMPTY: Any = object()
+_DELETED: Any = object()
+
 
 class HashMap(Generic[K, V]):
     """
-    Hash Map implementation using chaining.
+    Hash Map implementation using open addressing with linear probing.
+
+    Keys and values live in two parallel lists of slots. A key is stored in
+    the first free slot at or after its home index `hash(key) & mask`, so a
+    lookup scans a few neighbouring slots of one contiguous list instead of
+    a separate bucket list per index. Removed keys leave a tombstone that
+    keeps later keys of the same probe sequence reachable. The table doubles
+    once more than MAX_LOAD_FACTOR of its slots are in use.
 
     Attributes:
-        _capacity: Initial number of buckets.
+        _capacity: Number of slots, always a power of two.
+        _mask: Bit mask (capacity - 1) that maps a hash to a home slot.
         _length: Number of key-value pairs stored.
-        _buckets: List of buckets, each containing (key, value) pairs.
+        _used: Number of slots holding a key or a tombstone.
+        _keys: Key of each slot, or an empty/deleted marker.
+        _values: Value of each slot, None where no key is stored.
     """
+    __slots__ = ("_capacity", "_mask", "_length", "_used", "_keys", "_values")
     _capacity: int
+    _mask: int
     _length: int
-    _buckets: list[list[tuple[K, V]]]
+    _used: int
+    _keys: list[Any]
+    _values: list[Any]
 
     def __init__(self, capacity: int = 8) -> None:
-        """Initialize an empty hash map."""
-        self._capacity = capacity
-        self._length = 0
-        self._buckets = [[] for _ in range(capacity)]
+        """
+        Initialize an empty hash map.
+
+        Args:
+            capacity: Minimum number of slots; rounded up to a power of two
+                so a slot index is a bit mask instead of a modulo.
+
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("Hash map capacity must be at least 1")
+        self._allocate(1 << (capacity - 1).bit_length())
 
     def __len__(self) -> int:
         """Return the total number of key-value pairs."""
@@ -30,33 +59,21 @@ class HashMap(Generic[K, V]):
 
     def __repr__(self) -> str:
         """Return a string representation for debugging."""
-        pairs = []
-        for bucket in self._buckets:
-            for k, v in bucket:
-                pairs.append(f"{repr(k)}: {repr(v)}")
-        content = ", ".join(pairs)
-        return f"HashMap({{{content}}})"
+        return f"HashMap({{{self._format_pairs()}}})"
 
     def __str__(self) -> str:
         """Return a string representation like a Python dictionary."""
-        if self.is_empty:
-            return "{}"
-        pairs = []
-        for bucket in self._buckets:
-            for k, v in bucket:
-                pairs.append(f"{repr(k)}: {repr(v)}")
-        return "{" + ", ".join(pairs) + "}"
+        return "{" + self._format_pairs() + "}"
 
     def __iter__(self) -> Iterator[K]:
         """Allow iteration over all keys in the map."""
-        for bucket in self._buckets:
-            for k, _ in bucket:
+        for k in self._keys:
+            if k is not _EMPTY and k is not _DELETED:
                 yield k
 
     def __contains__(self, key: Any) -> bool:
         """Enable 'in' operator support."""
-        index = self._hash(key)
-        return self._find_index_in_bucket(index, key) is not None
+        return self._find_slot(key) >= 0
 
     @property
     def is_empty(self) -> bool:
@@ -73,16 +90,38 @@ class HashMap(Generic[K, V]):
             key: Key to insert or update.
             value: Value associated with the key.
         """
-        index = self._hash(key)
-        bucket = self._buckets[index]
-
-        entry_index = self._find_index_in_bucket(index, key)
-
-        if entry_index is not None:
-            bucket[entry_index] = (key, value)
+        keys = self._keys
+        mask = self._mask
+        i = self._hash(key)
+        tombstone = -1
+
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif k is key or k == key:
+                self._values[i] = value
+                return
+            i = (i + 1) & mask
+
+        # Reuse the first tombstone on the probe path if there was one.
+        if tombstone >= 0:
+            i = tombstone
         else:
-            bucket.append((key, value))
-            self._length += 1
+            self._used += 1
+        keys[i] = key
+        self._values[i] = value
+        self._length += 1
+
+        if self._used > self._capacity * MAX_LOAD_FACTOR:
+            # Mostly tombstones: rehash in place; otherwise grow.
+            if self._length * 2 < self._used:
+                self._resize(self._capacity)
+            else:
+                self._resize(self._capacity * 2)
 
     def remove(self, key: K) -> bool:
         """
@@ -94,20 +133,18 @@ class HashMap(Generic[K, V]):
         Returns:
             True if key was removed, False otherwise.
         """
-        index = self._hash(key)
-        entry_index = self._find_index_in_bucket(index, key)
-
-        if entry_index is not None:
-            del self._buckets[index][entry_index]
-            self._length -= 1
-            return True
+        i = self._find_slot(key)
+        if i < 0:
+            return False
 
-        return False
+        self._keys[i] = _DELETED
+        self._values[i] = None
+        self._length -= 1
+        return True
 
     def clear(self) -> None:
         """Remove all key-value pairs from the map."""
-        self._buckets = [[] for _ in range(self._capacity)]
-        self._length = 0
+        self._allocate(self._capacity)
 
     # --- Access Methods ---
 
@@ -121,13 +158,8 @@ class HashMap(Generic[K, V]):
         Returns:
             The associated value, or None if the key is not found.
         """
-        index = self._hash(key)
-        entry_index = self._find_index_in_bucket(index, key)
-
-        if entry_index is not None:
-            return self._buckets[index][entry_index][1]
-
-        return None
+        i = self._find_slot(key)
+        return self._values[i] if i >= 0 else None
 
     def keys(self) -> list[K]:
         """Return a list of all keys in the map."""
@@ -135,31 +167,72 @@ class HashMap(Generic[K, V]):
 
     def values(self) -> list[V]:
         """Return a list of all values in the map."""
-        all_values = []
-        for bucket in self._buckets:
-            for _, v in bucket:
-                all_values.append(v)
-        return all_values
+        return [
+            v
+            for k, v in zip(self._keys, self._values)
+            if k is not _EMPTY and k is not _DELETED
+        ]
 
     # --- Private Helpers ---
 
     def _hash(self, key: Any) -> int:
-        """Compute the bucket index for a given key."""
-        return hash(key) % self._capacity
-
-    def _find_index_in_bucket(self, bucket_index: int, key: Any) -> Optional[int]:
+        """Compute the home slot index for a given key."""
+        return hash(key) & self._mask
+
+    def _format_pairs(self) -> str:
+        """Return the stored pairs formatted as 'key: value', comma separated."""
+        # join() on a list sizes the result once; a generator is copied first.
+        return ", ".join([
+            f"{k!r}: {v!r}"
+            for k, v in zip(self._keys, self._values)
+            if k is not _EMPTY and k is not _DELETED
+        ])
+
+    def _find_slot(self, key: Any) -> int:
         """
-        Find the index of a key within a specific bucket.
+        Find the slot holding a key by probing from its home slot.
 
         Args:
-            bucket_index: The index of the bucket to search in.
             key: The key to look for.
 
         Returns:
-            The integer index within the bucket list, or None if not found.
+            The index of the slot holding `key`, or -1 if not found.
         """
-        bucket = self._buckets[bucket_index]
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
+        keys = self._keys
+        mask = self._mask
+        i = self._hash(key)
+
+        # The load factor guarantees an empty slot, so the probe terminates.
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if k is not _DELETED and (k is key or k == key):
                 return i
-        return None
+            i = (i + 1) & mask
+
+    def _allocate(self, capacity: int) -> None:
+        """Replace the table with `capacity` empty slots."""
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._length = 0
+        self._used = 0
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+
+    def _resize(self, capacity: int) -> None:
+        """Rehash every stored pair into a table of `capacity` slots."""
+        old_keys, old_values = self._keys, self._values
+        self._allocate(capacity)
+
+        keys, values, mask = self._keys, self._values, self._mask
+        for k, v in zip(old_keys, old_values):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            i = hash(k) & mask
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+            keys[i] = k
+            values[i] = v
+            self._length += 1
+        self._used = self._length
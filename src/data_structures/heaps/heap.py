@@ -1,4 +1,5 @@
 from __future__ import annotations
+import heapq
 from typing import TypeVar, Generic, Iterator, Any, Protocol
 
 
@@ -17,6 +18,7 @@ class Heap(Generic[T]):
     Attributes:
         _heap: Internal list representing the heap's complete binary tree.
     """
+    __slots__ = ("_heap",)
     _heap: list[T]
 
     def __init__(self) -> None:
@@ -74,15 +76,16 @@ class Heap(Generic[T]):
         Raises:
             IndexError: If the heap is empty.
         """
-        if self.is_empty:
+        heap = self._heap
+        if not heap:
             raise IndexError("pop from an empty heap")
 
-        root_value = self._heap[0]
-        last_item = self._heap.pop()
+        root_value = heap[0]
+        last_item = heap.pop()
 
-        if not self.is_empty:
-            self._heap[0] = last_item
-            self._sift_down(self._heap, len(self._heap), 0)
+        if heap:
+            heap[0] = last_item
+            self._sift_down(heap, len(heap), 0)
 
         return root_value
 
@@ -112,7 +115,7 @@ class Heap(Generic[T]):
         original_state = self._heap[:]
         result = []
         try:
-            while not self.is_empty:
+            while self._heap:
                 result.append(self.pop())
         finally:
             self._heap = original_state
@@ -146,19 +149,27 @@ class Heap(Generic[T]):
             n: Total number of elements in the array.
             i: Index of the element to sift down.
         """
-        better = i
+        is_better = self._is_better
+        item = arr[i]
         left = 2 * i + 1
-        right = 2 * i + 2
 
-        if left < n and self._is_better(arr[left], arr[better]):
-            better = left
+        while left < n:
+            # Pick the better child first, then a single comparison
+            # against the sinking item decides whether to keep sifting.
+            right = left + 1
+            child = right if right < n and is_better(arr[right], arr[left]) else left
+            child_value = arr[child]
+
+            if not is_better(child_value, item):
+                break
 
-        if right < n and self._is_better(arr[right], arr[better]):
-            better = right
+            # Move the child up into the hole instead of swapping; the
+            # sinking item is written once, at its final position.
+            arr[i] = child_value
+            i = child
+            left = 2 * i + 1
 
-        if better != i:
-            arr[i], arr[better] = arr[better], arr[i]
-            self._sift_down(arr, n, better)
+        arr[i] = item
 
     def _sift_up(self, arr: list[T], i: int) -> None:
         """
@@ -168,17 +179,23 @@ class Heap(Generic[T]):
             arr: The list representing the heap.
             i: Index of the element to sift up.
         """
-        if i == 0:
-            return
+        is_better = self._is_better
+        item = arr[i]
+
+        while i > 0:
+            parent = (i - 1) // 2
+            parent_value = arr[parent]
+            if not is_better(item, parent_value):
+                break
+            arr[i] = parent_value
+            i = parent
 
-        parent = (i - 1) // 2
-        if self._is_better(arr[i], arr[parent]):
-            arr[i], arr[parent] = arr[parent], arr[i]
-            self._sift_up(arr, parent)
+        arr[i] = item
 
 
 class MaxHeap(Heap[T]):
     """Max-Heap implementation where the largest element is at the root."""
+    __slots__ = ()
 
     def _is_better(self, val1: T, val2: T) -> bool:
         """Compare two values for Max-Heap priority."""
@@ -186,7 +203,48 @@ class MaxHeap(Heap[T]):
 
 
 class MinHeap(Heap[T]):
-    """Min-Heap implementation where the smallest element is at the root."""
+    """
+    Min-Heap implementation where the smallest element is at the root.
+
+    The heap layout matches the one used by the standard library, so the
+    modification methods delegate to the C-implemented `heapq` module instead
+    of the Python-level sift helpers.
+    """
+    __slots__ = ()
+
+    def heapify(self, arr: list[T]) -> None:
+        """
+        Transform a list into a valid heap in-place.
+
+        Args:
+            arr: A list of elements to be transformed into a heap.
+        """
+        heapq.heapify(arr)
+        self._heap = list(arr)
+
+    def push(self, value: T) -> None:
+        """
+        Add a new element to the heap and maintain heap property.
+
+        Args:
+            value: The element to be added to the heap.
+        """
+        heapq.heappush(self._heap, value)
+
+    def pop(self) -> T:
+        """
+        Remove and return the smallest element of the heap.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if self.is_empty:
+            raise IndexError("pop from an empty heap")
+        return heapq.heappop(self._heap)
+
+    def sort(self) -> list[T]:
+        """Return all elements in ascending order without destroying the heap."""
+        return sorted(self._heap)
 
     def _is_better(self, val1: T, val2: T) -> bool:
         """Compare two values for Min-Heap priority."""
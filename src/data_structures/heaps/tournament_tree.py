@@ -0,0 +1,182 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Iterable, Optional, Any, Protocol
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+    def __gt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class TournamentTree(Generic[T]):
+    """
+    Winner (tournament) tree over a fixed number of slots.
+
+    Leaves hold the current value of every slot and each internal node caches
+    the index of the slot that wins its subtree, so the root always points to
+    the smallest value. Replacing a slot replays only the matches on the path
+    to the root: one comparison per level (log2 k), which makes the structure
+    a good fit for k-way merges over a fixed set of sources.
+
+    Attributes:
+        _k: Number of slots (leaves) in the tree.
+        _values: Current value of each slot, or None once it is exhausted.
+        _winners: Implicit tree of 2k nodes storing the winning slot index.
+    """
+    _k: int
+    _values: list[Optional[T]]
+    _winners: list[int]
+
+    def __init__(self, k: int) -> None:
+        """
+        Initialize a tournament tree with `k` empty slots.
+
+        Args:
+            k: Number of slots in the tree.
+
+        Raises:
+            ValueError: If `k` is not positive.
+        """
+        if k < 1:
+            raise ValueError("Tournament tree needs at least one slot")
+
+        self._k = k
+        self._values = [None] * k
+        self._winners = [0] * k + list(range(k))
+        for pos in range(k - 1, 0, -1):
+            self._winners[pos] = self._play(
+                self._winners[2 * pos], self._winners[2 * pos + 1]
+            )
+
+    def __len__(self) -> int:
+        """Return the number of slots currently holding a value."""
+        return sum(value is not None for value in self._values)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the tree for debugging."""
+        return f"TournamentTree({self._values})"
+
+    @property
+    def capacity(self) -> int:
+        """Return the fixed number of slots in the tree."""
+        return self._k
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if no slot currently holds a value."""
+        return self._values[self._winners[1]] is None
+
+    # --- Modification Methods ---
+
+    def replace(self, index: int, value: T) -> None:
+        """
+        Set the value of a slot and replay its path to the root.
+
+        Args:
+            index: Slot whose value should be replaced.
+            value: The new value of the slot.
+
+        Raises:
+            IndexError: If index is out of range.
+        """
+        self._check_index(index)
+        self._values[index] = value
+        self._replay(index)
+
+    def remove(self, index: int) -> None:
+        """
+        Mark a slot as exhausted so it never wins again until replaced.
+
+        Args:
+            index: Slot to clear.
+
+        Raises:
+            IndexError: If index is out of range.
+        """
+        self._check_index(index)
+        self._values[index] = None
+        self._replay(index)
+
+    # --- Access Methods ---
+
+    def winner(self) -> int:
+        """
+        Return the index of the slot holding the smallest value.
+
+        Raises:
+            IndexError: If every slot is empty.
+        """
+        if self.is_empty:
+            raise IndexError("winner from an empty tournament tree")
+        return self._winners[1]
+
+    def peek(self) -> T:
+        """
+        Return the smallest value without removing it.
+
+        Raises:
+            IndexError: If every slot is empty.
+        """
+        value = self._values[self._winners[1]]
+        if value is None:
+            raise IndexError("peek from an empty tournament tree")
+        return value
+
+    # --- Private Helpers ---
+
+    def _play(self, a: int, b: int) -> int:
+        """Return the slot index that wins the match between slots a and b."""
+        value_a = self._values[a]
+        value_b = self._values[b]
+        if value_a is None:
+            return b
+        if value_b is None:
+            return a
+        return b if value_b < value_a else a
+
+    def _replay(self, index: int) -> None:
+        """Recompute the winners on the path from a leaf to the root."""
+        winners = self._winners
+        pos = (self._k + index) // 2
+        while pos >= 1:
+            winners[pos] = self._play(winners[2 * pos], winners[2 * pos + 1])
+            pos //= 2
+
+    def _check_index(self, index: int) -> None:
+        """Raise IndexError if index does not address a slot."""
+        if index < 0 or index >= self._k:
+            raise IndexError("Index out of range")
+
+
+def k_way_merge(lists: Iterable[Iterable[T]]) -> list[T]:
+    """
+    Merge several sorted iterables into one sorted list.
+
+    Args:
+        lists: Iterables, each already sorted in ascending order.
+
+    Returns:
+        A list with every element of the inputs in ascending order.
+    """
+    sources = [iter(source) for source in lists]
+    if not sources:
+        return []
+
+    tree: TournamentTree[T] = TournamentTree(len(sources))
+    for i, source in enumerate(sources):
+        for value in source:
+            tree.replace(i, value)
+            break
+
+    result = []
+    while not tree.is_empty:
+        i = tree.winner()
+        result.append(tree.peek())
+        for value in sources[i]:
+            tree.replace(i, value)
+            break
+        else:
+            tree.remove(i)
+    return result
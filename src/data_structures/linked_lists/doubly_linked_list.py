@@ -13,6 +13,7 @@ class Node(Generic[T]):
         next: Pointer to the next node in the list.
         prev: Pointer to the previous node in the list.
     """
+    __slots__ = ("value", "next", "prev")
     value: T
     next: Optional[Node[T]]
     prev: Optional[Node[T]]
@@ -153,7 +154,7 @@ class DoublyLinkedList(Generic[T]):
             True if an element was deleted, False otherwise.
         """
         current = self._head
-        while current:
+        while current is not None:
             if current.value == key:
                 if current.prev:
                     current.prev.next = current.next
@@ -207,9 +208,11 @@ class DoublyLinkedList(Generic[T]):
         Returns:
             True if the element is found, False otherwise.
         """
-        for value in self:
-            if value == key:
+        current = self._head
+        while current is not None:
+            if current.value == key:
                 return True
+            current = current.next
         return False
 
     def get(self, index: int) -> T:
@@ -12,6 +12,7 @@ class Node(Generic[T]):
         value: The data stored in the node.
         next: Pointer to the next node in the list.
     """
+    __slots__ = ("value", "next")
     value: T
     next: Optional[Node[T]]
 
@@ -31,14 +32,18 @@ class SinglyLinkedList(Generic[T]):
 
     Attributes:
         _head: Reference to the first node in the list.
+        _tail: Reference to the last node in the list.
         _length: Total number of nodes in the list.
     """
+    __slots__ = ("_head", "_tail", "_length")
     _head: Optional[Node[T]]
+    _tail: Optional[Node[T]]
     _length: int
 
     def __init__(self) -> None:
         """Initialize an empty singly linked list."""
         self._head = None
+        self._tail = None
         self._length = 0
 
     def __len__(self) -> int:
@@ -77,14 +82,11 @@ class SinglyLinkedList(Generic[T]):
         """
         new_node = Node(value)
 
-        if self.is_empty:
-            self._head = new_node
+        if self._tail is None:
+            self._head = self._tail = new_node
         else:
-            current = self._head
-            while current and current.next:
-                current = current.next
-            if current:
-                current.next = new_node
+            self._tail.next = new_node
+            self._tail = new_node
 
         self._length += 1
 
@@ -98,6 +100,8 @@ class SinglyLinkedList(Generic[T]):
         new_node = Node(value)
         new_node.next = self._head
         self._head = new_node
+        if self._tail is None:
+            self._tail = new_node
         self._length += 1
 
     def insert(self, index: int, value: T) -> None:
@@ -117,6 +121,9 @@ class SinglyLinkedList(Generic[T]):
         if index == 0:
             self.prepend(value)
             return
+        if index == self._length:
+            self.append(value)
+            return
 
         prev_node = self._get_node(index - 1)
         new_node = Node(value)
@@ -148,6 +155,9 @@ class SinglyLinkedList(Generic[T]):
                 else:
                     self._head = current.next
 
+                if current is self._tail:
+                    self._tail = prev
+
                 self._length -= 1
                 return True
 
@@ -159,6 +169,7 @@ class SinglyLinkedList(Generic[T]):
     def clear(self) -> None:
         """Remove all elements from the list."""
         self._head = None
+        self._tail = None
         self._length = 0
 
     # --- Access & Search Methods ---
@@ -208,6 +219,10 @@ class SinglyLinkedList(Generic[T]):
         if index < 0 or index >= self._length:
             raise IndexError("Index out of range")
 
+        # Optimization: the last node is cached, no traversal needed
+        if index == self._length - 1 and self._tail is not None:
+            return self._tail
+
         current = self._head
         for _ in range(index):
             if current:
@@ -0,0 +1,207 @@
+from __future__ import annotations
+import random
+from typing import TypeVar, Generic, Optional, Iterator, Any, Protocol
+
+MAX_LEVEL = 32
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+    def __gt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class SkipNode(Generic[T]):
+    """
+    Node class for a skip list.
+
+    Attributes:
+        value: The data stored in the node.
+        next: Forward pointers, one per level of the node's tower.
+    """
+    __slots__ = ("value", "next")
+    value: T
+    next: list[Optional[SkipNode[T]]]
+
+    def __init__(self, value: T, level: int) -> None:
+        """Initialize a node with a given value and tower height."""
+        self.value = value
+        self.next = [None] * level
+
+    def __repr__(self) -> str:
+        """Return a string representation of the node."""
+        return f"SkipNode({self.value})"
+
+
+class SkipList(Generic[T]):
+    """
+    Skip List implementation of an ordered set.
+
+    Every node carries a tower of forward pointers whose height is drawn from
+    a geometric distribution, which gives expected O(log n) search, insert and
+    delete without any rebalancing, regardless of insertion order.
+
+    Attributes:
+        _head: Forward pointers of the sentinel head, one per possible level.
+        _level: Number of levels currently in use.
+        _length: Total number of nodes in the list.
+        _random: Random number generator used to draw tower heights.
+    """
+    _head: list[Optional[SkipNode[T]]]
+    _level: int
+    _length: int
+    _random: random.Random
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize an empty skip list.
+
+        Args:
+            seed: Optional seed for reproducible tower heights.
+        """
+        self._head = [None] * MAX_LEVEL
+        self._level = 0
+        self._length = 0
+        self._random = random.Random(seed)
+
+    def __len__(self) -> int:
+        """Return the number of elements in the list."""
+        return self._length
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list."""
+        return f"SkipList({list(self)})"
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over elements in ascending order."""
+        current = self._head[0]
+        while current is not None:
+            yield current.value
+            current = current.next[0]
+
+    def __contains__(self, value: Any) -> bool:
+        """Enable 'in' operator support."""
+        return self.search(value)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the list contains no elements."""
+        return self._length == 0
+
+    # --- Modification Methods ---
+
+    def insert(self, value: T) -> None:
+        """
+        Insert a value, ignoring it if it is already present.
+
+        Args:
+            value: The value to add.
+        """
+        update = self._find_predecessors(value)
+        target = update[0][0]
+        if target is not None and target.value == value:
+            return
+
+        level = self._random_level()
+        if level > self._level:
+            for lvl in range(self._level, level):
+                update[lvl] = self._head
+            self._level = level
+
+        new_node = SkipNode(value, level)
+        for lvl in range(level):
+            new_node.next[lvl] = update[lvl][lvl]
+            update[lvl][lvl] = new_node
+
+        self._length += 1
+
+    def delete(self, value: T) -> bool:
+        """
+        Delete the given value from the list.
+
+        Args:
+            value: Value to delete.
+
+        Returns:
+            True if the value was deleted, False otherwise.
+        """
+        update = self._find_predecessors(value)
+        target = update[0][0]
+        if target is None or target.value != value:
+            return False
+
+        for lvl in range(len(target.next)):
+            update[lvl][lvl] = target.next[lvl]
+
+        while self._level > 0 and self._head[self._level - 1] is None:
+            self._level -= 1
+
+        self._length -= 1
+        return True
+
+    def clear(self) -> None:
+        """Remove all elements from the list."""
+        self._head = [None] * MAX_LEVEL
+        self._level = 0
+        self._length = 0
+
+    # --- Query & Search Methods ---
+
+    def search(self, value: T) -> bool:
+        """
+        Search for a value in the list.
+
+        Args:
+            value: The value to find.
+
+        Returns:
+            True if found, False otherwise.
+        """
+        forward = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = forward[lvl]
+            while nxt is not None and nxt.value < value:
+                forward = nxt.next
+                nxt = forward[lvl]
+
+        target = forward[0]
+        return target is not None and target.value == value
+
+    def height(self) -> int:
+        """
+        Return the number of levels currently in use.
+
+        Returns:
+            The height of the tallest tower in the list.
+        """
+        return self._level
+
+    # --- Private Helpers ---
+
+    def _find_predecessors(self, value: T) -> list[list[Optional[SkipNode[T]]]]:
+        """
+        Collect, for each level, the forward pointers that precede `value`.
+
+        Args:
+            value: The value to position.
+
+        Returns:
+            A list indexed by level holding the forward-pointer array of the
+            last node (or the head) whose value is smaller than `value`.
+        """
+        update = [self._head] * MAX_LEVEL
+        forward = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = forward[lvl]
+            while nxt is not None and nxt.value < value:
+                forward = nxt.next
+                nxt = forward[lvl]
+            update[lvl] = forward
+        return update
+
+    def _random_level(self) -> int:
+        """Draw a tower height from a geometric(0.5) distribution."""
+        bits = self._random.getrandbits(MAX_LEVEL) | (1 << (MAX_LEVEL - 1))
+        return (bits & -bits).bit_length()
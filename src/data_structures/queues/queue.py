@@ -1,22 +1,23 @@
 from __future__ import annotations
+from collections import deque
 from typing import TypeVar, Generic, Iterator
-from src.data_structures.linked_lists.doubly_linked_list import DoublyLinkedList
 
 T = TypeVar("T")
 
 
 class Queue(Generic[T]):
     """
-    Queue data structure implemented using a doubly linked list.
+    Queue data structure implemented using a double-ended queue.
 
     Attributes:
-        _items: Internal doubly linked list to store queue elements.
+        _items: Internal deque (block-linked array) to store queue elements.
     """
-    _items: DoublyLinkedList[T]
+    __slots__ = ("_items",)
+    _items: deque[T]
 
     def __init__(self) -> None:
         """Initialize an empty queue."""
-        self._items = DoublyLinkedList()
+        self._items = deque()
 
     def __len__(self) -> int:
         """Return the number of elements in the queue."""
@@ -33,7 +34,7 @@ class Queue(Generic[T]):
     @property
     def is_empty(self) -> bool:
         """Check if the queue contains no elements."""
-        return len(self) == 0
+        return not self._items
 
     # --- Modification Methods ---
 
@@ -58,7 +59,7 @@ class Queue(Generic[T]):
         """
         if self.is_empty:
             raise IndexError("Queue is empty")
-        return self._items.pop_front()
+        return self._items.popleft()
 
     def clear(self) -> None:
         """Remove all elements from the queue."""
@@ -75,7 +76,7 @@ class Queue(Generic[T]):
         """
         if self.is_empty:
             raise IndexError("Queue is empty")
-        return self._items.peek_front()
+        return self._items[0]
 
     def back(self) -> T:
         """
@@ -86,4 +87,4 @@ class Queue(Generic[T]):
         """
         if self.is_empty:
             raise IndexError("Queue is empty")
-        return self._items.peek_back()
+        return self._items[-1]
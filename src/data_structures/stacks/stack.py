@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Iterator
+from typing import TypeVar, Generic, Iterable, Iterator
 
 T = TypeVar("T")
 
@@ -11,12 +11,28 @@ class Stack(Generic[T]):
     Attributes:
         _items: Internal list to store stack elements.
     """
+    __slots__ = ("_items",)
     _items: list[T]
 
     def __init__(self) -> None:
         """Initialize an empty stack using a dynamic array."""
         self._items = []
 
+    @classmethod
+    def from_iterable(cls, items: Iterable[T]) -> Stack[T]:
+        """
+        Build a stack by pushing every item of an iterable.
+
+        Args:
+            items: Values to push, from bottom to top.
+
+        Returns:
+            A new stack whose top is the last item.
+        """
+        stack = cls()
+        stack.extend(items)
+        return stack
+
     def __len__(self) -> int:
         """Return the number of elements in the stack."""
         return len(self._items)
@@ -45,6 +61,17 @@ class Stack(Generic[T]):
         """
         self._items.append(item)
 
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Push every item of an iterable in order.
+
+        A single list.extend() call replaces one push() call per item.
+
+        Args:
+            items: Values to push; the last one ends up on top.
+        """
+        self._items.extend(items)
+
     def pop(self) -> T:
         """
         Remove and return the element from the top of the stack.
@@ -0,0 +1,226 @@
+from __future__ import annotations
+from typing import (
+    TypeVar, Generic, Optional, Iterable, Iterator, Sequence, Any, Protocol
+)
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+    def __gt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class ArrayBinarySearchTree(Generic[T]):
+    """
+    Binary Search Tree stored as an implicit heap-style array.
+
+    The children of the slot at index `i` live at `2i + 1` and `2i + 2`, so
+    there are no node objects and no child pointers: descending the tree is
+    plain index arithmetic over one contiguous list, and the next child is
+    computed as `2i + 1 + (current < value)` without branching on the side.
+    This suits small or dense trees. A skewed tree needs a slot for every
+    position down to its deepest leaf, so worst-case memory grows
+    exponentially with the height.
+
+    Attributes:
+        _values: Slots of the implicit tree, None where no node exists.
+        _length: Total number of values stored in the tree.
+    """
+    _values: list[Optional[T]]
+    _length: int
+
+    def __init__(self) -> None:
+        """Initialize an empty array-backed Binary Search Tree."""
+        self._values = []
+        self._length = 0
+
+    @classmethod
+    def from_sorted(cls, values: Sequence[T]) -> ArrayBinarySearchTree[T]:
+        """
+        Build a complete tree in Eytzinger (BFS) order from sorted values.
+
+        The sorted values are written into the slots in inorder sequence of
+        the implicit complete tree, so the array has exactly `len(values)`
+        slots with no holes and every search touches ceil(log2(n + 1))
+        levels at most.
+
+        Args:
+            values: Values sorted in ascending order, without duplicates.
+
+        Returns:
+            A new array-backed tree holding `values`.
+        """
+        tree: ArrayBinarySearchTree[T] = cls()
+        n = len(values)
+        slots: list[Optional[T]] = [None] * n
+        stack: list[int] = []
+        position = 0
+        i = 0
+
+        while stack or i < n:
+            while i < n:
+                stack.append(i)
+                i = 2 * i + 1
+
+            i = stack.pop()
+            slots[i] = values[position]
+            position += 1
+            i = 2 * i + 2
+
+        tree._values = slots
+        tree._length = n
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> ArrayBinarySearchTree[T]:
+        """
+        Build a complete tree in Eytzinger order from values in any order.
+
+        Args:
+            values: Values to store; duplicates are ignored.
+
+        Returns:
+            A new array-backed tree holding `values`.
+        """
+        ordered = sorted(values)
+        unique = [
+            value
+            for i, value in enumerate(ordered)
+            if i == 0 or ordered[i - 1] < value
+        ]
+        return cls.from_sorted(unique)
+
+    def __len__(self) -> int:
+        """Return the total number of values in the tree."""
+        return self._length
+
+    def __repr__(self) -> str:
+        """Return a string representation of the tree."""
+        return f"ArrayBinarySearchTree({list(self)})"
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over elements in sorted (inorder) order."""
+        values = self._values
+        size = len(values)
+        stack: list[int] = []
+        i = 0
+
+        while stack or (i < size and values[i] is not None):
+            while i < size and values[i] is not None:
+                stack.append(i)
+                i = 2 * i + 1
+
+            i = stack.pop()
+            value = values[i]
+            if value is not None:
+                yield value
+            i = 2 * i + 2
+
+    def __contains__(self, value: Any) -> bool:
+        """Enable 'in' operator support."""
+        return self.search(value)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the tree contains no values."""
+        return self._length == 0
+
+    # --- Modification Methods ---
+
+    def insert(self, value: T) -> None:
+        """
+        Insert a new value into the tree, ignoring duplicates.
+
+        Args:
+            value: The value to add.
+        """
+        values = self._values
+        size = len(values)
+        i = 0
+
+        while i < size:
+            current = values[i]
+            if current is None:
+                break
+            if value == current:
+                return
+            i = 2 * i + 1 + (current < value)
+
+        if i >= size:
+            values.extend([None] * (i - size + 1))
+        values[i] = value
+        self._length += 1
+
+    def clear(self) -> None:
+        """Remove all values from the tree."""
+        self._values = []
+        self._length = 0
+
+    # --- Query & Search Methods ---
+
+    def search(self, value: T) -> bool:
+        """
+        Search for a value in the tree.
+
+        Args:
+            value: The value to find.
+
+        Returns:
+            True if found, False otherwise.
+        """
+        values = self._values
+        size = len(values)
+        i = 0
+
+        while i < size:
+            current = values[i]
+            if current is None:
+                return False
+            if value == current:
+                return True
+            i = 2 * i + 1 + (current < value)
+        return False
+
+    def search_many(self, values: Iterable[T]) -> list[bool]:
+        """
+        Search for every value of an iterable in the tree.
+
+        Args:
+            values: The values to find.
+
+        Returns:
+            A list with one membership flag per queried value, in order.
+        """
+        slots = self._values
+        size = len(slots)
+        result: list[bool] = []
+        out = result.append
+
+        for value in values:
+            found = False
+            i = 0
+            while i < size:
+                current = slots[i]
+                if current is None:
+                    break
+                if value == current:
+                    found = True
+                    break
+                i = 2 * i + 1 + (current < value)
+            out(found)
+        return result
+
+    def height(self) -> int:
+        """
+        Calculate the height of the tree.
+
+        Returns:
+            The number of levels from the root to the deepest node.
+        """
+        values = self._values
+        for i in range(len(values) - 1, -1, -1):
+            if values[i] is not None:
+                return (i + 1).bit_length()
+        return 0
@@ -0,0 +1,248 @@
+from __future__ import annotations
+from typing import TypeVar, Optional, Iterable, Sequence, Any, Protocol
+from src.data_structures.trees.binary_search_tree import BinarySearchTree, Node
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+    def __gt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class AVLNode(Node[T]):
+    """
+    Represents a node in an AVL tree.
+
+    Attributes:
+        value: The value stored in the node.
+        left: Reference to the left child node (smaller values).
+        right: Reference to the right child node (larger values).
+        height: Number of levels of the subtree rooted at this node.
+    """
+    __slots__ = ("height",)
+    left: Optional[AVLNode[T]]
+    right: Optional[AVLNode[T]]
+    height: int
+
+    def __init__(self, value: T) -> None:
+        """Initialize a leaf node."""
+        super().__init__(value)
+        self.height = 1
+
+    def __repr__(self) -> str:
+        """Return a string representation of the node."""
+        return f"AVLNode({self.value})"
+
+    @property
+    def balance_factor(self) -> int:
+        """Return the left subtree height minus the right subtree height."""
+        return _height(self.left) - _height(self.right)
+
+
+class AVLTree(BinarySearchTree[T]):
+    """
+    Self-balancing Binary Search Tree (AVL tree).
+
+    Every node stores the height of its subtree, and after each insertion the
+    nodes on the path back to the root are rotated whenever their balance
+    factor leaves [-1, 1]. The height therefore stays below 1.44 * log2(n + 2)
+    even for sorted input, which would degrade a plain BST into a linked list.
+    Search and traversals are inherited unchanged.
+
+    Attributes:
+        _root: The top-level node of the tree.
+        _length: Total number of nodes in the tree.
+        _height: Number of levels from the root to the deepest node.
+    """
+    _root: Optional[AVLNode[T]]
+
+    @classmethod
+    def from_sorted(cls, values: Sequence[T]) -> AVLTree[T]:
+        """
+        Build a balanced tree from strictly increasing values in O(n).
+
+        Args:
+            values: Values sorted in ascending order, without duplicates.
+
+        Returns:
+            A new AVL tree holding `values`.
+        """
+        tree: AVLTree[T] = cls()
+        n = len(values)
+        if n == 0:
+            return tree
+
+        mid = n // 2
+        root = AVLNode(values[mid])
+        root.height = n.bit_length()
+        tree._root = root
+        tree._length = n
+        tree._height = root.height
+
+        # A range of m values always forms a subtree of m.bit_length() levels.
+        stack = [(root, 0, mid, n)]
+        while stack:
+            node, lo, mid, hi = stack.pop()
+            if lo < mid:
+                left_mid = (lo + mid) // 2
+                left = AVLNode(values[left_mid])
+                left.height = (mid - lo).bit_length()
+                node.left = left
+                stack.append((left, lo, left_mid, mid))
+            if mid + 1 < hi:
+                right_mid = (mid + 1 + hi) // 2
+                right = AVLNode(values[right_mid])
+                right.height = (hi - mid - 1).bit_length()
+                node.right = right
+                stack.append((right, mid + 1, right_mid, hi))
+        return tree
+
+    # --- Modification Methods ---
+
+    def insert(self, value: T) -> None:
+        """
+        Insert a new value into the tree and restore the AVL balance.
+
+        Args:
+            value: The value to add.
+        """
+        path: list[AVLNode[T]] = []
+        candidate = None
+        node = self._root
+
+        while node is not None:
+            path.append(node)
+            if value < node.value:
+                node = node.left
+            else:
+                candidate = node
+                node = node.right
+
+        if candidate is not None and candidate.value == value:
+            return
+
+        new_node = AVLNode(value)
+        self._length += 1
+        if not path:
+            self._root = new_node
+            self._height = 1
+            return
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        # Retrace towards the root. A single rotation restores the height the
+        # subtree had before the insertion, so nothing above it can change.
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if i == 0:
+                    self._root = subtree
+                elif path[i - 1].left is node:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+                break
+            if node.height == old_height:
+                break
+
+        root = self._root
+        self._height = root.height if root is not None else 0
+
+    def insert_many(self, values: Iterable[T]) -> None:
+        """
+        Insert every value of an iterable into the tree.
+
+        Args:
+            values: The values to add, in insertion order.
+        """
+        insert = self.insert
+        for value in values:
+            insert(value)
+
+    # --- Private Helpers ---
+
+    @staticmethod
+    def _rebalance(node: AVLNode[T]) -> AVLNode[T]:
+        """
+        Update the height of `node` and rotate it if it is out of balance.
+
+        Args:
+            node: The root of a subtree whose children are balanced.
+
+        Returns:
+            The root of the balanced subtree.
+        """
+        _update_height(node)
+        balance = node.balance_factor
+
+        if balance > 1:
+            left = node.left
+            assert left is not None
+            if left.balance_factor < 0:
+                node.left = _rotate_left(left)
+            return _rotate_right(node)
+
+        if balance < -1:
+            right = node.right
+            assert right is not None
+            if right.balance_factor > 0:
+                node.right = _rotate_right(right)
+            return _rotate_left(node)
+
+        return node
+
+
+def _height(node: Optional[AVLNode[Any]]) -> int:
+    """Return the height of a subtree, 0 for an empty one."""
+    return node.height if node is not None else 0
+
+
+def _update_height(node: AVLNode[Any]) -> None:
+    """Recompute the height of `node` from its children."""
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _rotate_left(node: AVLNode[T]) -> AVLNode[T]:
+    """
+    Rotate a subtree to the left.
+
+    Args:
+        node: Subtree root with a right child.
+
+    Returns:
+        The new subtree root (the former right child).
+    """
+    pivot = node.right
+    assert pivot is not None
+    node.right = pivot.left
+    pivot.left = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+
+def _rotate_right(node: AVLNode[T]) -> AVLNode[T]:
+    """
+    Rotate a subtree to the right.
+
+    Args:
+        node: Subtree root with a left child.
+
+    Returns:
+        The new subtree root (the former left child).
+    """
+    pivot = node.left
+    assert pivot is not None
+    node.left = pivot.right
+    pivot.right = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
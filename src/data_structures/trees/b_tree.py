@@ -0,0 +1,216 @@
+from __future__ import annotations
+from bisect import bisect_left
+from typing import TypeVar, Generic, Iterator, Any, Protocol
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+    def __gt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class BTreeNode(Generic[T]):
+    """
+    Represents a node in a B-Tree.
+
+    Attributes:
+        keys: Sorted values stored in the node.
+        children: Child nodes; empty for leaves, otherwise len(keys) + 1.
+    """
+    __slots__ = ("keys", "children")
+    keys: list[T]
+    children: list[BTreeNode[T]]
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.keys = []
+        self.children = []
+
+    def __repr__(self) -> str:
+        """Return a string representation of the node."""
+        return f"BTreeNode({self.keys})"
+
+    @property
+    def is_leaf(self) -> bool:
+        """Check if the node has no children."""
+        return not self.children
+
+
+class BTree(Generic[T]):
+    """
+    B-Tree implementation of an ordered set.
+
+    Each node packs between `degree - 1` and `2 * degree - 1` sorted keys
+    (the root may hold fewer), so a lookup does a binary search inside one
+    flat list and then follows a single child reference. Compared to a
+    binary tree this cuts the number of node objects and pointer hops by
+    roughly a factor of `degree`, and the tree stays balanced on any input.
+
+    Attributes:
+        _root: The top-level node of the tree.
+        _degree: Minimum degree; nodes split once they hold 2 * degree - 1 keys.
+        _length: Total number of keys in the tree.
+    """
+    _root: BTreeNode[T]
+    _degree: int
+    _length: int
+
+    def __init__(self, degree: int = 8) -> None:
+        """
+        Initialize an empty B-Tree.
+
+        Args:
+            degree: Minimum degree of the tree (at least 2).
+
+        Raises:
+            ValueError: If `degree` is smaller than 2.
+        """
+        if degree < 2:
+            raise ValueError("B-Tree degree must be at least 2")
+
+        self._root = BTreeNode()
+        self._degree = degree
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Return the total number of keys in the tree."""
+        return self._length
+
+    def __repr__(self) -> str:
+        """Return a string representation of the tree."""
+        return f"BTree({list(self)})"
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over elements in sorted (inorder) order."""
+        return self._inorder(self._root)
+
+    def __contains__(self, value: Any) -> bool:
+        """Enable 'in' operator support."""
+        return self.search(value)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the tree contains no keys."""
+        return self._length == 0
+
+    # --- Modification Methods ---
+
+    def insert(self, value: T) -> None:
+        """
+        Insert a new value into the tree, ignoring duplicates.
+
+        Full nodes are split on the way down, so the insertion never has to
+        walk back up the tree.
+
+        Args:
+            value: The value to add.
+        """
+        max_keys = 2 * self._degree - 1
+
+        if len(self._root.keys) == max_keys:
+            new_root: BTreeNode[T] = BTreeNode()
+            new_root.children.append(self._root)
+            self._split_child(new_root, 0)
+            self._root = new_root
+
+        node = self._root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, value)
+            if i < len(keys) and keys[i] == value:
+                return
+
+            if node.is_leaf:
+                keys.insert(i, value)
+                break
+
+            if len(node.children[i].keys) == max_keys:
+                self._split_child(node, i)
+                if keys[i] == value:
+                    return
+                if keys[i] < value:
+                    i += 1
+            node = node.children[i]
+
+        self._length += 1
+
+    def clear(self) -> None:
+        """Remove all keys from the tree."""
+        self._root = BTreeNode()
+        self._length = 0
+
+    # --- Query & Search Methods ---
+
+    def search(self, value: T) -> bool:
+        """
+        Search for a value in the tree.
+
+        Args:
+            value: The value to find.
+
+        Returns:
+            True if found, False otherwise.
+        """
+        node = self._root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, value)
+            if i < len(keys) and keys[i] == value:
+                return True
+            if node.is_leaf:
+                return False
+            node = node.children[i]
+
+    def height(self) -> int:
+        """
+        Calculate the height of the tree.
+
+        Returns:
+            The number of node levels from the root to the leaves.
+        """
+        if self.is_empty:
+            return 0
+
+        height = 1
+        node = self._root
+        while not node.is_leaf:
+            node = node.children[0]
+            height += 1
+        return height
+
+    # --- Private Helpers ---
+
+    def _split_child(self, parent: BTreeNode[T], index: int) -> None:
+        """
+        Split the full child at `index`, moving its median key into `parent`.
+
+        Args:
+            parent: A non-full node whose child should be split.
+            index: Position of the full child within `parent.children`.
+        """
+        t = self._degree
+        child = parent.children[index]
+        sibling: BTreeNode[T] = BTreeNode()
+
+        median = child.keys[t - 1]
+        sibling.keys = child.keys[t:]
+        child.keys = child.keys[: t - 1]
+        if child.children:
+            sibling.children = child.children[t:]
+            child.children = child.children[:t]
+
+        parent.keys.insert(index, median)
+        parent.children.insert(index + 1, sibling)
+
+    def _inorder(self, node: BTreeNode[T]) -> Iterator[T]:
+        """Helper to yield the keys of a subtree in sorted order."""
+        if node.is_leaf:
+            yield from node.keys
+            return
+
+        for i, key in enumerate(node.keys):
+            yield from self._inorder(node.children[i])
+            yield key
+        yield from self._inorder(node.children[-1])
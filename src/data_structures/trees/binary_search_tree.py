@@ -1,7 +1,11 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Optional, Iterator, Any, Protocol
-from src.data_structures.queues.queue import Queue
-from src.data_structures.stacks.stack import Stack
+from collections import deque
+from typing import (
+    TypeVar, Generic, Optional, Iterable, Iterator, Sequence, Any, Protocol
+)
+from src.data_structures.trees.frozen_binary_search_tree import (
+    FrozenBinarySearchTree,
+)
 
 
 class Comparable(Protocol):
@@ -21,6 +25,7 @@ class Node(Generic[T]):
         left: Reference to the left child node (smaller values).
         right: Reference to the right child node (larger values).
     """
+    __slots__ = ("value", "left", "right")
     value: T
     left: Optional[Node[T]]
     right: Optional[Node[T]]
@@ -42,16 +47,79 @@ class BinarySearchTree(Generic[T]):
 
     Attributes:
         _root: The top-level node of the tree.
+        _length: Total number of nodes in the tree.
+        _height: Number of levels from the root to the deepest node.
     """
     _root: Optional[Node[T]]
+    _length: int
+    _height: int
 
     def __init__(self) -> None:
         """Initialize an empty Binary Search Tree."""
         self._root = None
+        self._length = 0
+        self._height = 0
+
+    @classmethod
+    def from_sorted(cls, values: Sequence[T]) -> BinarySearchTree[T]:
+        """
+        Build a balanced tree from strictly increasing values in O(n).
+
+        The middle value of every range becomes the subtree root, so no
+        comparisons are performed and the height is ceil(log2(n + 1)).
+
+        Args:
+            values: Values sorted in ascending order, without duplicates.
+
+        Returns:
+            A new balanced Binary Search Tree holding `values`.
+        """
+        tree: BinarySearchTree[T] = cls()
+        n = len(values)
+        if n == 0:
+            return tree
+
+        mid = n // 2
+        tree._root = Node(values[mid])
+        tree._length = n
+        tree._height = n.bit_length()
+
+        # Each frame is a node and the [lo, hi) range it was taken from.
+        stack = [(tree._root, 0, mid, n)]
+        while stack:
+            node, lo, mid, hi = stack.pop()
+            if lo < mid:
+                left_mid = (lo + mid) // 2
+                node.left = Node(values[left_mid])
+                stack.append((node.left, lo, left_mid, mid))
+            if mid + 1 < hi:
+                right_mid = (mid + 1 + hi) // 2
+                node.right = Node(values[right_mid])
+                stack.append((node.right, mid + 1, right_mid, hi))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> BinarySearchTree[T]:
+        """
+        Build a balanced tree from values in any order.
+
+        Args:
+            values: Values to store; duplicates are ignored.
+
+        Returns:
+            A new balanced Binary Search Tree holding `values`.
+        """
+        ordered = sorted(values)
+        unique = [
+            value
+            for i, value in enumerate(ordered)
+            if i == 0 or ordered[i - 1] < value
+        ]
+        return cls.from_sorted(unique)
 
     def __len__(self) -> int:
         """Return the total number of nodes in the tree."""
-        return self._size(self._root)
+        return self._length
 
     def __repr__(self) -> str:
         """Return a string representation of the tree."""
@@ -59,18 +127,23 @@ class BinarySearchTree(Generic[T]):
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over elements in sorted (inorder) order."""
-        stack: Stack[Node[T]] = Stack()
+        stack: list[Node[T]] = []
+        push, pop = stack.append, stack.pop
         current = self._root
 
-        while current or not stack.is_empty:
+        while current or stack:
             while current:
-                stack.push(current)
+                push(current)
                 current = current.left
 
-            current = stack.pop()
+            current = pop()
             yield current.value
             current = current.right
 
+    def __contains__(self, value: Any) -> bool:
+        """Enable 'in' operator support."""
+        return self.search(value)
+
     @property
     def is_empty(self) -> bool:
         """Check if the tree contains no nodes."""
@@ -82,17 +155,107 @@ class BinarySearchTree(Generic[T]):
         """
         Insert a new value into the BST.
 
+        The descent does a single `<` comparison per level and remembers the
+        last node it passed on the right; only that node can be equal to
+        `value`, so duplicates are detected with one `==` at the end.
+
         Args:
             value: The value to add.
         """
-        if self._root is None:
-            self._root = Node(value)
+        parent = None
+        candidate = None
+        go_left = False
+        depth = 1
+        node = self._root
+
+        while node is not None:
+            parent = node
+            depth += 1
+            go_left = value < node.value
+            if go_left:
+                node = node.left
+            else:
+                candidate = node
+                node = node.right
+
+        if candidate is not None and candidate.value == value:
+            return
+
+        new_node = Node(value)
+        if parent is None:
+            self._root = new_node
+        elif go_left:
+            parent.left = new_node
         else:
-            self._insert_recursive(self._root, value)
+            parent.right = new_node
+        self._length += 1
+        if depth > self._height:
+            self._height = depth
+
+    def insert_many(self, values: Iterable[T]) -> None:
+        """
+        Insert every value of an iterable into the BST.
+
+        The descent runs inline for the whole batch, so bulk loading avoids
+        one method call per value compared to calling `insert` in a loop.
+
+        Args:
+            values: The values to add, in insertion order.
+        """
+        length = self._length
+        height = self._height
+
+        try:
+            for value in values:
+                parent = None
+                candidate = None
+                go_left = False
+                depth = 1
+                node = self._root
+
+                while node is not None:
+                    parent = node
+                    depth += 1
+                    go_left = value < node.value
+                    if go_left:
+                        node = node.left
+                    else:
+                        candidate = node
+                        node = node.right
+
+                if candidate is not None and candidate.value == value:
+                    continue
+
+                new_node = Node(value)
+                if parent is None:
+                    self._root = new_node
+                elif go_left:
+                    parent.left = new_node
+                else:
+                    parent.right = new_node
+                length += 1
+                if depth > height:
+                    height = depth
+        finally:
+            self._length = length
+            self._height = height
+
+    def balance(self) -> None:
+        """
+        Rebuild the tree in place with the minimum possible height.
+
+        Useful after sorted or nearly sorted insertions have degraded the
+        tree into a long chain; runs in O(n) without recursion.
+        """
+        rebuilt = self.from_sorted(self.inorder())
+        self._root = rebuilt._root
+        self._height = rebuilt._height
 
     def clear(self) -> None:
         """Remove all nodes from the tree."""
         self._root = None
+        self._length = 0
+        self._height = 0
 
     # --- Query & Search Methods ---
 
@@ -106,21 +269,60 @@ class BinarySearchTree(Generic[T]):
         Returns:
             True if found, False otherwise.
         """
+        candidate = None
         current = self._root
-        while current:
-            if value == current.value:
-                return True
-            current = current.left if value < current.value else current.right
-        return False
+        while current is not None:
+            if value < current.value:
+                current = current.left
+            else:
+                candidate = current
+                current = current.right
+        return candidate is not None and candidate.value == value
+
+    def search_many(self, values: Iterable[T]) -> list[bool]:
+        """
+        Search for every value of an iterable in the tree.
+
+        Args:
+            values: The values to find.
+
+        Returns:
+            A list with one membership flag per queried value, in order.
+        """
+        root = self._root
+        result = []
+
+        for value in values:
+            candidate = None
+            current = root
+            while current is not None:
+                if value < current.value:
+                    current = current.left
+                else:
+                    candidate = current
+                    current = current.right
+            result.append(candidate is not None and candidate.value == value)
+        return result
 
     def height(self) -> int:
         """
-        Calculate the height of the tree.
+        Return the height of the tree.
+
+        The height is tracked on insertion, so no traversal is needed.
 
         Returns:
-            The maximum number of edges from root to leaf.
+            The number of levels from the root to the deepest node.
         """
-        return self._height(self._root)
+        return self._height
+
+    def freeze(self) -> FrozenBinarySearchTree[T]:
+        """
+        Return an immutable, balanced, cache-oblivious copy of the tree.
+
+        Returns:
+            A FrozenBinarySearchTree holding the same values.
+        """
+        return FrozenBinarySearchTree.from_sorted(self.inorder())
 
     # --- Traversal Methods (DFS) ---
 
@@ -134,17 +336,18 @@ class BinarySearchTree(Generic[T]):
         if not self._root:
             return []
 
-        stack: Stack[Node[T]] = Stack()
-        stack.push(self._root)
-        result = []
-
-        while not stack.is_empty:
-            node = stack.pop()
-            result.append(node.value)
-            if node.right:
-                stack.push(node.right)
-            if node.left:
-                stack.push(node.left)
+        stack = [self._root]
+        result: list[T] = []
+        push, pop, out = stack.append, stack.pop, result.append
+
+        while stack:
+            node = pop()
+            out(node.value)
+            right, left = node.right, node.left
+            if right:
+                push(right)
+            if left:
+                push(left)
         return result
 
     def inorder(self) -> list[T]:
@@ -154,7 +357,36 @@ class BinarySearchTree(Generic[T]):
         Returns:
             A list of values in ascending order.
         """
-        return list(self)
+        # Morris traversal: each left subtree's rightmost node is temporarily
+        # threaded back to its inorder successor, so no stack is needed. The
+        # walk always runs to completion, which restores every thread before
+        # returning. __iter__ keeps the stack because a generator may be
+        # abandoned halfway and would leave the threads in place.
+        result: list[T] = []
+        out = result.append
+        current = self._root
+
+        while current is not None:
+            left = current.left
+            if left is None:
+                out(current.value)
+                current = current.right
+                continue
+
+            predecessor = left
+            thread = predecessor.right
+            while thread is not None and thread is not current:
+                predecessor = thread
+                thread = predecessor.right
+
+            if thread is None:
+                predecessor.right = current
+                current = left
+            else:
+                predecessor.right = None
+                out(current.value)
+                current = current.right
+        return result
 
     def postorder(self) -> list[T]:
         """
@@ -163,23 +395,25 @@ class BinarySearchTree(Generic[T]):
         Returns:
             A list of values in postorder sequence.
         """
-        stack: Stack[Node[T]] = Stack()
-        result = []
+        stack: list[Node[T]] = []
+        result: list[T] = []
+        push, pop, out = stack.append, stack.pop, result.append
         current = self._root
         last_visited = None
 
-        while current or not stack.is_empty:
+        while current or stack:
             while current:
-                stack.push(current)
+                push(current)
                 current = current.left
 
-            peek_node = stack.peek()
-            if not peek_node.right or last_visited == peek_node.right:
-                result.append(peek_node.value)
-                last_visited = stack.pop()
+            peek_node = stack[-1]
+            right = peek_node.right
+            if not right or last_visited is right:
+                out(peek_node.value)
+                last_visited = pop()
                 current = None
             else:
-                current = peek_node.right
+                current = right
         return result
 
     # --- Traversal Methods (BFS) ---
@@ -194,42 +428,16 @@ class BinarySearchTree(Generic[T]):
         if not self._root:
             return []
 
-        queue: Queue[Node[T]] = Queue()
-        queue.enqueue(self._root)
-        result = []
-
-        while not queue.is_empty:
-            node = queue.dequeue()
-            result.append(node.value)
-            if node.left:
-                queue.enqueue(node.left)
-            if node.right:
-                queue.enqueue(node.right)
+        queue: deque[Node[T]] = deque([self._root])
+        result: list[T] = []
+        enqueue, dequeue, out = queue.append, queue.popleft, result.append
+
+        while queue:
+            node = dequeue()
+            out(node.value)
+            left, right = node.left, node.right
+            if left:
+                enqueue(left)
+            if right:
+                enqueue(right)
         return result
-
-    # --- Private Helpers ---
-
-    def _insert_recursive(self, node: Node[T], value: T) -> None:
-        """Helper to recursively find the insertion point."""
-        if value < node.value:
-            if node.left is None:
-                node.left = Node(value)
-            else:
-                self._insert_recursive(node.left, value)
-        elif value > node.value:
-            if node.right is None:
-                node.right = Node(value)
-            else:
-                self._insert_recursive(node.right, value)
-
-    def _height(self, node: Optional[Node[T]]) -> int:
-        """Helper to recursively calculate the depth of the tree."""
-        if node is None:
-            return 0
-        return 1 + max(self._height(node.left), self._height(node.right))
-
-    def _size(self, node: Optional[Node[T]]) -> int:
-        """Helper to recursively count nodes."""
-        if node is None:
-            return 0
-        return 1 + self._size(node.left) + self._size(node.right)
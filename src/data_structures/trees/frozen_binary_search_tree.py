@@ -0,0 +1,230 @@
+from __future__ import annotations
+from array import array
+from functools import lru_cache, _lru_cache_wrapper
+from typing import (
+    TypeVar, Generic, Optional, Iterable, Iterator, Sequence, Any,
+    Protocol,
+)
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+    def __gt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class FrozenBinarySearchTree(Generic[T]):
+    """
+    Immutable balanced Binary Search Tree in van Emde Boas layout.
+
+    The balanced tree is cut at half its height: the top subtree is stored
+    first, followed by each bottom subtree, and every piece is laid out the
+    same way recursively. A root-to-leaf path therefore touches few
+    contiguous blocks at every cache level without knowing the cache sizes.
+    Nodes are stored as parallel arrays (struct of arrays): a list of values
+    and two C int arrays of child indices (-1 for no child), so there are no
+    per-node objects and the links take 4 bytes each.
+
+    Attributes:
+        _values: Values in van Emde Boas order; the root is at index 0.
+        _left: Index of each slot's left child, or -1.
+        _right: Index of each slot's right child, or -1.
+        _height: Number of levels of the balanced tree.
+    """
+    _values: list[T]
+    _left: array[int]
+    _right: array[int]
+    _height: int
+
+    def __init__(self) -> None:
+        """Initialize an empty frozen tree."""
+        self._values = []
+        self._left = array("i")
+        self._right = array("i")
+        self._height = 0
+
+    @classmethod
+    def from_sorted(cls, values: Sequence[T]) -> FrozenBinarySearchTree[T]:
+        """
+        Build a frozen tree from strictly increasing values.
+
+        Args:
+            values: Values sorted in ascending order, without duplicates.
+
+        Returns:
+            A new frozen tree holding `values`.
+        """
+        tree: FrozenBinarySearchTree[T] = cls()
+        n = len(values)
+        if n == 0:
+            return tree
+
+        # The balanced shape uses the middle of every [lo, hi) range as the
+        # subtree root, so a node is identified by its index in `values`.
+        order: list[int] = []
+        _van_emde_boas_order(0, n, n.bit_length(), order)
+
+        position = [0] * n
+        for slot, index in enumerate(order):
+            position[index] = slot
+
+        left = array("i", [-1]) * n
+        right = array("i", [-1]) * n
+        stack = [(0, n)]
+        while stack:
+            lo, hi = stack.pop()
+            mid = (lo + hi) // 2
+            if lo < mid:
+                left[position[mid]] = position[(lo + mid) // 2]
+                stack.append((lo, mid))
+            if mid + 1 < hi:
+                right[position[mid]] = position[(mid + 1 + hi) // 2]
+                stack.append((mid + 1, hi))
+
+        tree._values = [values[index] for index in order]
+        tree._left = left
+        tree._right = right
+        tree._height = n.bit_length()
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> FrozenBinarySearchTree[T]:
+        """
+        Build a frozen tree from values in any order.
+
+        Args:
+            values: Values to store; duplicates are ignored.
+
+        Returns:
+            A new frozen tree holding `values`.
+        """
+        ordered = sorted(values)
+        unique = [
+            value
+            for i, value in enumerate(ordered)
+            if i == 0 or ordered[i - 1] < value
+        ]
+        return cls.from_sorted(unique)
+
+    def __len__(self) -> int:
+        """Return the total number of values in the tree."""
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the tree."""
+        return f"FrozenBinarySearchTree({list(self)})"
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over elements in sorted (inorder) order."""
+        values, left, right = self._values, self._left, self._right
+        stack: list[int] = []
+        i = 0 if values else -1
+
+        while i != -1 or stack:
+            while i != -1:
+                stack.append(i)
+                i = left[i]
+
+            i = stack.pop()
+            yield values[i]
+            i = right[i]
+
+    def __contains__(self, value: Any) -> bool:
+        """Enable 'in' operator support."""
+        return self.search(value)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the tree contains no values."""
+        return not self._values
+
+    # --- Query & Search Methods ---
+
+    def search(self, value: T) -> bool:
+        """
+        Search for a value in the tree.
+
+        Args:
+            value: The value to find.
+
+        Returns:
+            True if found, False otherwise.
+        """
+        values = self._values
+        # Indexed by the comparison result: False -> left, True -> right.
+        children = (self._left, self._right)
+        i = 0 if values else -1
+
+        while i != -1:
+            current = values[i]
+            if value == current:
+                return True
+            i = children[current < value][i]
+        return False
+
+    def cached_search(
+        self, maxsize: Optional[int] = 1024
+    ) -> _lru_cache_wrapper[bool]:
+        """
+        Return a memoized version of `search` for repeated hot-key lookups.
+
+        No public method changes a frozen tree, so cached answers stay valid
+        for the tree's lifetime. If its storage is ever rebuilt in place,
+        call `cache_clear()` on the returned function, or it will keep
+        returning answers for the old contents. Values passed to the
+        returned function must be hashable.
+
+        Args:
+            maxsize: Maximum number of cached answers, None for no limit.
+
+        Returns:
+            A function with the same result as `search`, backed by an LRU
+            cache that exposes `cache_info()` and `cache_clear()`.
+        """
+        return lru_cache(maxsize=maxsize)(self.search)
+
+    def height(self) -> int:
+        """
+        Return the height of the tree.
+
+        Returns:
+            The number of levels from the root to the deepest node.
+        """
+        return self._height
+
+
+def _van_emde_boas_order(lo: int, hi: int, height: int, order: list[int]) -> None:
+    """
+    Append the nodes of a balanced subtree to `order` in van Emde Boas order.
+
+    Args:
+        lo: Start of the value range covered by the subtree.
+        hi: End (exclusive) of the value range covered by the subtree.
+        height: Number of levels of the subtree to lay out.
+        order: Output list of node indices (the middle of each range).
+    """
+    if lo >= hi:
+        return
+    if height == 1:
+        order.append((lo + hi) // 2)
+        return
+
+    top = height // 2
+    _van_emde_boas_order(lo, hi, top, order)
+
+    # Roots of the bottom subtrees are the ranges found `top` levels down.
+    ranges = [(lo, hi)]
+    for _ in range(top):
+        next_ranges = []
+        for r_lo, r_hi in ranges:
+            mid = (r_lo + r_hi) // 2
+            if r_lo < mid:
+                next_ranges.append((r_lo, mid))
+            if mid + 1 < r_hi:
+                next_ranges.append((mid + 1, r_hi))
+        ranges = next_ranges
+
+    for r_lo, r_hi in ranges:
+        _van_emde_boas_order(r_lo, r_hi, height - top, order)
@@ -0,0 +1,223 @@
+from __future__ import annotations
+import math
+from typing import TypeVar, Optional, Iterable, Any, Protocol
+from src.data_structures.trees.binary_search_tree import BinarySearchTree, Node
+
+DEFAULT_ALPHA = 0.7
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+    def __gt__(self, other: Any) -> bool: ...
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class ScapegoatTree(BinarySearchTree[T]):
+    """
+    Self-balancing Binary Search Tree that rebuilds subtrees (scapegoat tree).
+
+    Nodes carry no balance metadata. When an insertion lands deeper than
+    log_{1/alpha}(n), the path back up is searched for the lowest ancestor
+    whose child holds more than `alpha` of its subtree, and only that
+    subtree is flattened and rebuilt perfectly balanced. This gives
+    O(log n) worst-case search and amortized O(log n) insertion, and
+    balanced input never pays for any rebalancing work.
+
+    Attributes:
+        _root: The top-level node of the tree.
+        _length: Total number of nodes in the tree.
+        _alpha: Weight-balance factor in [0.5, 1).
+        _log_base: Natural logarithm of 1 / alpha, used for the depth limit.
+    """
+    _alpha: float
+    _log_base: float
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA) -> None:
+        """
+        Initialize an empty scapegoat tree.
+
+        Args:
+            alpha: Weight-balance factor; lower values keep the tree
+                shallower at the cost of more frequent rebuilds.
+
+        Raises:
+            ValueError: If alpha is outside [0.5, 1).
+        """
+        if not 0.5 <= alpha < 1:
+            raise ValueError("Scapegoat tree alpha must be in [0.5, 1)")
+        super().__init__()
+        self._alpha = alpha
+        self._log_base = math.log(1 / alpha)
+
+    # --- Modification Methods ---
+
+    def insert(self, value: T) -> None:
+        """
+        Insert a new value and rebuild the scapegoat subtree if needed.
+
+        Args:
+            value: The value to add.
+        """
+        path: list[Node[T]] = []
+        candidate = None
+        node = self._root
+
+        while node is not None:
+            path.append(node)
+            if value < node.value:
+                node = node.left
+            else:
+                candidate = node
+                node = node.right
+
+        if candidate is not None and candidate.value == value:
+            return
+
+        new_node = Node(value)
+        self._length += 1
+        if not path:
+            self._root = new_node
+            return
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        # The new node sits len(path) edges below the root.
+        if len(path) > math.log(self._length) / self._log_base:
+            self._rebuild_scapegoat(path, new_node)
+
+    def insert_many(self, values: Iterable[T]) -> None:
+        """
+        Insert every value of an iterable into the tree.
+
+        Args:
+            values: The values to add, in insertion order.
+        """
+        insert = self.insert
+        for value in values:
+            insert(value)
+
+    # --- Query & Search Methods ---
+
+    def height(self) -> int:
+        """
+        Calculate the height of the tree.
+
+        Rebuilds can shorten any branch, so the height is not cached and is
+        measured level by level in O(n).
+
+        Returns:
+            The number of levels from the root to the deepest node.
+        """
+        levels = 0
+        level = [self._root] if self._root is not None else []
+
+        while level:
+            levels += 1
+            next_level = []
+            for node in level:
+                if node.left is not None:
+                    next_level.append(node.left)
+                if node.right is not None:
+                    next_level.append(node.right)
+            level = next_level
+        return levels
+
+    # --- Private Helpers ---
+
+    def _rebuild_scapegoat(self, path: list[Node[T]], node: Node[T]) -> None:
+        """
+        Find the lowest alpha-unbalanced ancestor of `node` and rebuild it.
+
+        Args:
+            path: Ancestors of `node`, from the root down to its parent.
+            node: The node that was just inserted too deep.
+        """
+        size = 1
+        child = node
+
+        for i in range(len(path) - 1, -1, -1):
+            parent = path[i]
+            sibling = parent.right if parent.left is child else parent.left
+            parent_size = size + 1 + _count(sibling)
+
+            if size > self._alpha * parent_size:
+                subtree = _build_balanced(_flatten(parent))
+                if i == 0:
+                    self._root = subtree
+                elif path[i - 1].left is parent:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+                return
+
+            size = parent_size
+            child = parent
+
+
+def _count(node: Optional[Node[Any]]) -> int:
+    """Count the nodes of a subtree without recursion."""
+    count = 0
+    stack = [node] if node is not None else []
+    while stack:
+        current = stack.pop()
+        count += 1
+        if current.left is not None:
+            stack.append(current.left)
+        if current.right is not None:
+            stack.append(current.right)
+    return count
+
+
+def _flatten(node: Node[T]) -> list[Node[T]]:
+    """Return the nodes of a subtree in inorder sequence."""
+    nodes: list[Node[T]] = []
+    stack: list[Node[T]] = []
+    current: Optional[Node[T]] = node
+
+    while current is not None or stack:
+        while current is not None:
+            stack.append(current)
+            current = current.left
+
+        current = stack.pop()
+        nodes.append(current)
+        current = current.right
+    return nodes
+
+
+def _build_balanced(nodes: list[Node[T]]) -> Node[T]:
+    """
+    Relink nodes given in inorder sequence into a perfectly balanced subtree.
+
+    Args:
+        nodes: The existing nodes of a subtree, in inorder sequence.
+
+    Returns:
+        The root of the rebuilt subtree.
+    """
+    n = len(nodes)
+    mid = n // 2
+    root = nodes[mid]
+
+    stack = [(root, 0, mid, n)]
+    while stack:
+        node, lo, mid, hi = stack.pop()
+        if lo < mid:
+            left_mid = (lo + mid) // 2
+            node.left = nodes[left_mid]
+            stack.append((node.left, lo, left_mid, mid))
+        else:
+            node.left = None
+        if mid + 1 < hi:
+            right_mid = (mid + 1 + hi) // 2
+            node.right = nodes[right_mid]
+            stack.append((node.right, mid + 1, right_mid, hi))
+        else:
+            node.right = None
+    return root
@@ -0,0 +1,148 @@
+import pytest
+from src.data_structures.trees.array_binary_search_tree import (
+    ArrayBinarySearchTree,
+)
+
+# --- Constants ---
+#  Tree Structure
+#        50
+#       /  \
+#     30    70
+#    /  \   /  \
+#   20  40 60  80
+
+TEST_DATA_INPUT = [50, 30, 20, 40, 70, 60, 80]
+
+EXPECTED_INORDER = [20, 30, 40, 50, 60, 70, 80]
+
+TREE_SIZE = 7
+TREE_HEIGHT = 3
+
+
+# --- Fixtures ---
+@pytest.fixture
+def empty_tree():
+    """Return an empty array-backed tree."""
+    return ArrayBinarySearchTree()
+
+
+@pytest.fixture
+def populated_tree():
+    """Return an array-backed tree populated with TEST_DATA_INPUT."""
+    bt = ArrayBinarySearchTree()
+    for val in TEST_DATA_INPUT:
+        bt.insert(val)
+    return bt
+
+
+# --- Tests: Basic Status ---
+def test_is_empty(empty_tree, populated_tree):
+    """Check is_empty() works correctly."""
+    assert empty_tree.is_empty
+    assert not populated_tree.is_empty
+
+
+def test_len(empty_tree, populated_tree):
+    """Check __len__() counts stored values."""
+    assert len(empty_tree) == 0
+    assert len(populated_tree) == TREE_SIZE
+
+
+def test_height(empty_tree, populated_tree):
+    """Check tree height calculation."""
+    assert empty_tree.height() == 0
+    assert populated_tree.height() == TREE_HEIGHT
+
+
+# --- Tests: Search ---
+@pytest.mark.parametrize("value", TEST_DATA_INPUT)
+def test_search_found(populated_tree, value):
+    """Check that search finds existing elements."""
+    assert populated_tree.search(value)
+
+
+def test_search_not_found(populated_tree, empty_tree):
+    """Check that search returns False for missing elements."""
+    assert not populated_tree.search(999)
+    assert not populated_tree.search(0)
+    assert not populated_tree.search(35)
+    assert not empty_tree.search(50)
+
+
+def test_contains(populated_tree, empty_tree):
+    """Check 'in' operator uses the tree search."""
+    assert 50 in populated_tree
+    assert 80 in populated_tree
+    assert 35 not in populated_tree
+    assert 50 not in empty_tree
+
+
+def test_search_many(populated_tree, empty_tree):
+    """Check batch search returns one flag per query, in order."""
+    queries = [50, 999, 20, 0, 80, 35]
+    expected = [True, False, True, False, True, False]
+    assert populated_tree.search_many(queries) == expected
+    assert empty_tree.search_many(queries) == [False] * len(queries)
+    assert populated_tree.search_many([]) == []
+
+
+# --- Tests: Insert Logic ---
+def test_insert_duplicates(populated_tree):
+    """Check that inserting duplicates keeps size same."""
+    populated_tree.insert(50)
+    populated_tree.insert(20)
+    assert len(populated_tree) == TREE_SIZE
+
+
+def test_insert_skewed(empty_tree):
+    """Check a skewed insertion order grows the array and stays ordered."""
+    for val in range(5):
+        empty_tree.insert(val)
+    assert list(empty_tree) == list(range(5))
+    assert empty_tree.height() == 5
+
+
+# --- Tests: Bulk Construction ---
+def test_from_sorted(populated_tree):
+    """Check from_sorted() lays out a complete tree without holes."""
+    tree = ArrayBinarySearchTree.from_sorted(EXPECTED_INORDER)
+    assert tree._values == populated_tree._values
+    assert len(tree) == TREE_SIZE
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 10, 100])
+def test_from_sorted_sizes(size):
+    """Check Eytzinger layout is searchable and ordered for any size."""
+    tree = ArrayBinarySearchTree.from_sorted(range(size))
+    assert list(tree) == list(range(size))
+    assert tree.height() == size.bit_length()
+    assert all(tree.search(val) for val in range(size))
+    assert not tree.search(size)
+
+
+def test_from_iterable():
+    """Check from_iterable() sorts and drops duplicates."""
+    tree = ArrayBinarySearchTree.from_iterable(TEST_DATA_INPUT[::-1] + [50, 20])
+    assert list(tree) == EXPECTED_INORDER
+    assert len(tree) == TREE_SIZE
+
+
+# --- Tests: Traversal & Clearing ---
+def test_inorder_traversal(populated_tree, empty_tree):
+    """Iteration should return values in sorted order."""
+    assert list(populated_tree) == EXPECTED_INORDER
+    assert list(empty_tree) == []
+
+
+def test_clear(populated_tree):
+    """Check clear() removes every value."""
+    populated_tree.clear()
+    assert populated_tree.is_empty
+    assert list(populated_tree) == []
+    assert populated_tree.height() == 0
+
+
+def test_str(empty_tree, populated_tree):
+    """Verify __str__() returns correct string representation."""
+    assert str(empty_tree) == "ArrayBinarySearchTree([])"
+    assert str(populated_tree) == f"ArrayBinarySearchTree({EXPECTED_INORDER})"
@@ -0,0 +1,161 @@
+import pickle
+import pytest
+from src.data_structures.trees.avl_tree import AVLTree
+
+# --- Constants ---
+#  Tree Structure
+#        50
+#       /  \
+#     30    70
+#    /  \   /  \
+#   20  40 60  80
+
+TEST_DATA_INPUT = [50, 30, 20, 40, 70, 60, 80]
+
+EXPECTED_INORDER = [20, 30, 40, 50, 60, 70, 80]
+EXPECTED_PREORDER = [50, 30, 20, 40, 70, 60, 80]
+
+TREE_SIZE = 7
+TREE_HEIGHT = 3
+
+# Sorted input that would make a plain BST 2000 levels deep
+DEGENERATE_SIZE = 2000
+# Upper bound on AVL height: 1.44 * log2(DEGENERATE_SIZE + 2)
+DEGENERATE_MAX_HEIGHT = 15
+
+
+# --- Fixtures ---
+@pytest.fixture
+def empty_tree():
+    """Return an empty AVL tree."""
+    return AVLTree()
+
+
+@pytest.fixture
+def populated_tree():
+    """Return an AVL tree populated with TEST_DATA_INPUT."""
+    tree = AVLTree()
+    for val in TEST_DATA_INPUT:
+        tree.insert(val)
+    return tree
+
+
+def assert_balanced(node):
+    """Check stored heights and balance factors of every node in a subtree."""
+    if node is None:
+        return 0
+    left = assert_balanced(node.left)
+    right = assert_balanced(node.right)
+    assert node.height == 1 + max(left, right)
+    assert abs(node.balance_factor) <= 1
+    return node.height
+
+
+# --- Tests: Basic Status ---
+def test_is_empty(empty_tree, populated_tree):
+    """Check is_empty() works correctly."""
+    assert empty_tree.is_empty
+    assert not populated_tree.is_empty
+
+
+def test_len(empty_tree, populated_tree):
+    """Check __len__() counts stored values."""
+    assert len(empty_tree) == 0
+    assert len(populated_tree) == TREE_SIZE
+
+
+def test_height(empty_tree, populated_tree):
+    """Check tree height calculation."""
+    assert empty_tree.height() == 0
+    assert populated_tree.height() == TREE_HEIGHT
+
+
+def test_pickle(populated_tree):
+    """Check node heights survive a pickle round trip."""
+    restored = pickle.loads(pickle.dumps(populated_tree))
+    assert not hasattr(restored._root, "__dict__")
+    assert restored.preorder() == EXPECTED_PREORDER
+    assert_balanced(restored._root)
+
+
+# --- Tests: Rotations ---
+@pytest.mark.parametrize(
+    "values",
+    [
+        [30, 20, 10],  # Left-Left: single right rotation
+        [10, 20, 30],  # Right-Right: single left rotation
+        [30, 10, 20],  # Left-Right: double rotation
+        [10, 30, 20],  # Right-Left: double rotation
+    ],
+)
+def test_rotations(empty_tree, values):
+    """Check each imbalance case ends with the median at the root."""
+    for val in values:
+        empty_tree.insert(val)
+    assert empty_tree.preorder() == [20, 10, 30]
+    assert empty_tree.height() == 2
+    assert_balanced(empty_tree._root)
+
+
+def test_insert_sorted_stays_balanced(empty_tree):
+    """Check sorted insertion keeps a logarithmic height."""
+    for val in range(DEGENERATE_SIZE):
+        empty_tree.insert(val)
+    assert len(empty_tree) == DEGENERATE_SIZE
+    assert empty_tree.height() <= DEGENERATE_MAX_HEIGHT
+    assert empty_tree.inorder() == list(range(DEGENERATE_SIZE))
+    assert_balanced(empty_tree._root)
+
+
+# --- Tests: Insert Logic ---
+def test_insert_duplicates(populated_tree):
+    """Check that inserting duplicates keeps size same."""
+    populated_tree.insert(50)
+    populated_tree.insert(20)
+    assert len(populated_tree) == TREE_SIZE
+    assert populated_tree.preorder() == EXPECTED_PREORDER
+
+
+def test_insert_many(empty_tree):
+    """Check bulk insertion rebalances like repeated insert()."""
+    empty_tree.insert_many(range(DEGENERATE_SIZE, 0, -1))
+    assert len(empty_tree) == DEGENERATE_SIZE
+    assert empty_tree.height() <= DEGENERATE_MAX_HEIGHT
+    assert_balanced(empty_tree._root)
+
+
+# --- Tests: Bulk Construction ---
+def test_from_sorted(populated_tree):
+    """Check from_sorted() stores correct heights on every node."""
+    tree = AVLTree.from_sorted(EXPECTED_INORDER)
+    assert tree.preorder() == populated_tree.preorder()
+    assert tree.height() == TREE_HEIGHT
+    assert_balanced(tree._root)
+
+    tree.insert(90)
+    tree.insert(100)
+    assert_balanced(tree._root)
+
+
+def test_from_iterable():
+    """Check from_iterable() returns an AVL tree."""
+    tree = AVLTree.from_iterable(TEST_DATA_INPUT[::-1] + [50, 20])
+    assert isinstance(tree, AVLTree)
+    assert list(tree) == EXPECTED_INORDER
+
+
+# --- Tests: Search & Traversal ---
+def test_search(populated_tree, empty_tree):
+    """Check search is inherited from the plain BST."""
+    assert all(populated_tree.search(val) for val in TEST_DATA_INPUT)
+    assert not populated_tree.search(35)
+    assert not empty_tree.search(50)
+
+
+def test_clear(populated_tree):
+    """Check clear() resets the tree."""
+    populated_tree.clear()
+    assert populated_tree.is_empty
+    assert populated_tree.height() == 0
+    populated_tree.insert(10)
+    assert populated_tree.height() == 1
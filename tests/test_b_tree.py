@@ -0,0 +1,104 @@
+import pytest
+from src.data_structures.trees.b_tree import BTree
+
+# --- Constants ---
+DEGREE = 2
+TEST_DATA_INPUT = [50, 30, 20, 40, 70, 60, 80, 10, 90, 35, 65, 25]
+EXPECTED_INORDER = sorted(TEST_DATA_INPUT)
+TREE_SIZE = len(TEST_DATA_INPUT)
+NOT_EXISTING_VALUES = [0, 45, 999]
+NUM_SORTED_INSERTS = 1000
+
+
+# --- Fixtures ---
+@pytest.fixture
+def empty_tree():
+    """Return an empty B-Tree with a small degree to force splits."""
+    return BTree(degree=DEGREE)
+
+
+@pytest.fixture
+def populated_tree():
+    """Return a B-Tree populated with TEST_DATA_INPUT."""
+    bt = BTree(degree=DEGREE)
+    for val in TEST_DATA_INPUT:
+        bt.insert(val)
+    return bt
+
+
+# --- Tests: Basic Status ---
+def test_is_empty(empty_tree, populated_tree):
+    """Check is_empty() works correctly."""
+    assert empty_tree.is_empty
+    assert not populated_tree.is_empty
+
+
+def test_len(empty_tree, populated_tree):
+    """Check __len__() counts stored keys."""
+    assert len(empty_tree) == 0
+    assert len(populated_tree) == TREE_SIZE
+
+
+def test_height(empty_tree, populated_tree):
+    """Check the tree grows in height only through root splits."""
+    assert empty_tree.height() == 0
+    assert 1 < populated_tree.height() < TREE_SIZE
+
+
+def test_invalid_degree():
+    """Verify a degree below 2 is rejected."""
+    with pytest.raises(ValueError):
+        BTree(degree=1)
+
+
+# --- Tests: Search ---
+@pytest.mark.parametrize("value", TEST_DATA_INPUT)
+def test_search_found(populated_tree, value):
+    """Check that search finds existing elements."""
+    assert populated_tree.search(value)
+    assert value in populated_tree
+
+
+@pytest.mark.parametrize("value", NOT_EXISTING_VALUES)
+def test_search_not_found(populated_tree, empty_tree, value):
+    """Check that search returns False for missing elements."""
+    assert not populated_tree.search(value)
+    assert not empty_tree.search(value)
+
+
+# --- Tests: Insert Logic ---
+def test_insert_duplicates(populated_tree):
+    """Check that inserting duplicates keeps size same."""
+    for val in TEST_DATA_INPUT:
+        populated_tree.insert(val)
+    assert len(populated_tree) == TREE_SIZE
+    assert list(populated_tree) == EXPECTED_INORDER
+
+
+def test_insert_sorted_input(empty_tree):
+    """Check that sorted input keeps the tree balanced."""
+    for val in range(NUM_SORTED_INSERTS):
+        empty_tree.insert(val)
+    assert list(empty_tree) == list(range(NUM_SORTED_INSERTS))
+    assert empty_tree.height() <= NUM_SORTED_INSERTS.bit_length()
+
+
+# --- Tests: Traversal & Clearing ---
+def test_inorder_traversal(populated_tree, empty_tree):
+    """Iteration should return keys in sorted order."""
+    assert list(populated_tree) == EXPECTED_INORDER
+    assert list(empty_tree) == []
+
+
+def test_clear(populated_tree):
+    """Check clear() removes every key."""
+    populated_tree.clear()
+    assert populated_tree.is_empty
+    assert list(populated_tree) == []
+    assert populated_tree.height() == 0
+
+
+def test_str(empty_tree, populated_tree):
+    """Verify __str__() returns correct string representation."""
+    assert str(empty_tree) == "BTree([])"
+    assert str(populated_tree) == f"BTree({EXPECTED_INORDER})"
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from src.data_structures.trees.binary_search_tree import BinarySearchTree
 
@@ -19,6 +20,9 @@ EXPECTED_LEVEL_ORDER = [50, 30, 70, 20, 40, 60, 80]  # By levels
 TREE_SIZE = 7
 TREE_HEIGHT = 3
 
+# Deeper than the default recursion limit
+DEGENERATE_SIZE = 2000
+
 
 # --- Fixtures ---
 @pytest.fixture
@@ -55,6 +59,19 @@ def test_height(empty_tree, populated_tree):
     assert populated_tree.height() == TREE_HEIGHT
 
 
+def test_node_slots(populated_tree):
+    """Ensure nodes store their links in slots instead of a per-node dict."""
+    assert not hasattr(populated_tree._root, "__dict__")
+
+
+def test_pickle(populated_tree):
+    """Check a tree of slotted nodes survives a pickle round trip."""
+    restored = pickle.loads(pickle.dumps(populated_tree))
+    assert restored.preorder() == EXPECTED_PREORDER
+    assert len(restored) == TREE_SIZE
+    assert restored.height() == TREE_HEIGHT
+
+
 # --- Tests: Search ---
 def test_search_found(populated_tree):
     """Check that search finds existing elements (root, leaf, middle)."""
@@ -71,6 +88,22 @@ def test_search_not_found(populated_tree, empty_tree):
     assert not empty_tree.search(50)
 
 
+def test_contains(populated_tree, empty_tree):
+    """Check 'in' operator uses the tree search."""
+    assert 50 in populated_tree
+    assert 80 in populated_tree
+    assert 35 not in populated_tree
+    assert 50 not in empty_tree
+
+
+def test_search_many(populated_tree, empty_tree):
+    """Check batch search returns one flag per query, in order."""
+    queries = [50, 999, 20, 0, 80]
+    assert populated_tree.search_many(queries) == [True, False, True, False, True]
+    assert empty_tree.search_many(queries) == [False] * len(queries)
+    assert populated_tree.search_many([]) == []
+
+
 # --- Tests: Insert Logic ---
 def test_insert_duplicates(populated_tree):
     """Check that inserting duplicates keeps size same."""
@@ -79,6 +112,18 @@ def test_insert_duplicates(populated_tree):
     assert len(populated_tree) == TREE_SIZE
 
 
+def test_len_after_clear(populated_tree):
+    """Check that cached size and height are reset by clear() and grow again."""
+    populated_tree.clear()
+    assert len(populated_tree) == 0
+    assert populated_tree.height() == 0
+
+    populated_tree.insert(10)
+    populated_tree.insert(5)
+    assert len(populated_tree) == 2
+    assert populated_tree.height() == 2
+
+
 def test_insert_single(empty_tree):
     """Check insertion into an empty tree."""
     empty_tree.insert(10)
@@ -87,6 +132,62 @@ def test_insert_single(empty_tree):
     assert empty_tree.search(10)
 
 
+def test_insert_many(empty_tree, populated_tree):
+    """Check bulk insertion builds the same tree as repeated insert()."""
+    empty_tree.insert_many(TEST_DATA_INPUT)
+    assert empty_tree.preorder() == populated_tree.preorder()
+    assert len(empty_tree) == TREE_SIZE
+
+    empty_tree.insert_many(TEST_DATA_INPUT)
+    assert len(empty_tree) == TREE_SIZE
+
+
+def test_insert_sorted_degenerate(empty_tree):
+    """Check that a fully skewed tree does not hit the recursion limit."""
+    for val in range(DEGENERATE_SIZE):
+        empty_tree.insert(val)
+    assert len(empty_tree) == DEGENERATE_SIZE
+    assert empty_tree.height() == DEGENERATE_SIZE
+    assert empty_tree.search(DEGENERATE_SIZE - 1)
+
+
+def test_balance(empty_tree, populated_tree):
+    """Check balance() rebuilds a degenerate tree with minimum height."""
+    for val in range(DEGENERATE_SIZE):
+        empty_tree.insert(val)
+    empty_tree.balance()
+    assert empty_tree.height() == DEGENERATE_SIZE.bit_length()
+    assert len(empty_tree) == DEGENERATE_SIZE
+    assert empty_tree.inorder() == list(range(DEGENERATE_SIZE))
+
+    populated_tree.balance()
+    assert populated_tree.preorder() == EXPECTED_PREORDER
+
+
+# --- Tests: Bulk Construction ---
+def test_from_sorted(populated_tree):
+    """Check from_sorted() builds the balanced tree without comparisons."""
+    tree = BinarySearchTree.from_sorted(EXPECTED_INORDER)
+    assert tree.preorder() == populated_tree.preorder()
+    assert len(tree) == TREE_SIZE
+    assert tree.height() == TREE_HEIGHT
+
+
+def test_from_sorted_large():
+    """Check sorted input of any size yields a tree of logarithmic height."""
+    tree = BinarySearchTree.from_sorted(range(DEGENERATE_SIZE))
+    assert tree.inorder() == list(range(DEGENERATE_SIZE))
+    assert tree.height() == DEGENERATE_SIZE.bit_length()
+    assert BinarySearchTree.from_sorted([]).is_empty
+
+
+def test_from_iterable(populated_tree):
+    """Check from_iterable() sorts, drops duplicates and balances."""
+    tree = BinarySearchTree.from_iterable(TEST_DATA_INPUT[::-1] + [50, 20])
+    assert tree.preorder() == populated_tree.preorder()
+    assert len(tree) == TREE_SIZE
+
+
 # --- Tests: Traversals ---
 def test_inorder_traversal(populated_tree, empty_tree):
     """Inorder traversal should return sorted list."""
@@ -94,6 +195,14 @@ def test_inorder_traversal(populated_tree, empty_tree):
     assert empty_tree.inorder() == []
 
 
+def test_inorder_restores_links(populated_tree):
+    """Inorder traversal must leave the tree structure untouched."""
+    populated_tree.inorder()
+    assert populated_tree.preorder() == EXPECTED_PREORDER
+    assert populated_tree.postorder() == EXPECTED_POSTORDER
+    assert populated_tree.height() == TREE_HEIGHT
+
+
 def test_preorder_traversal(populated_tree, empty_tree):
     """Preorder traversal validation."""
     assert populated_tree.preorder() == EXPECTED_PREORDER
@@ -226,6 +226,11 @@ def test_links_integrity(populated_list):
         current = current.next
 
 
+def test_node_slots(populated_list):
+    """Ensure nodes store their links in slots instead of a per-node dict."""
+    assert not hasattr(populated_list._get_head(), "__dict__")
+
+
 # --- Tests: Clearing the List ---
 def test_clear(empty_list, populated_list):
     """Check clear() empties the list and resets length, head, and tail."""
@@ -0,0 +1,118 @@
+import pytest
+from src.data_structures.trees.binary_search_tree import BinarySearchTree
+from src.data_structures.trees.frozen_binary_search_tree import (
+    FrozenBinarySearchTree,
+)
+
+# --- Constants ---
+#  Tree Structure
+#        50
+#       /  \
+#     30    70
+#    /  \   /  \
+#   20  40 60  80
+
+TEST_DATA_INPUT = [50, 30, 20, 40, 70, 60, 80]
+
+EXPECTED_INORDER = [20, 30, 40, 50, 60, 70, 80]
+
+TREE_SIZE = 7
+TREE_HEIGHT = 3
+
+# A perfect tree of height 4: the top 3 nodes come first, then each
+# bottom subtree of 3 nodes is stored contiguously.
+PERFECT_SIZE = 15
+EXPECTED_VEB_ORDER = [7, 3, 11, 1, 0, 2, 5, 4, 6, 9, 8, 10, 13, 12, 14]
+
+
+# --- Fixtures ---
+@pytest.fixture
+def empty_tree():
+    """Return an empty frozen tree."""
+    return FrozenBinarySearchTree()
+
+
+@pytest.fixture
+def populated_tree():
+    """Return a frozen tree built from TEST_DATA_INPUT."""
+    return FrozenBinarySearchTree.from_iterable(TEST_DATA_INPUT)
+
+
+# --- Tests: Basic Status ---
+def test_is_empty(empty_tree, populated_tree):
+    """Check is_empty() works correctly."""
+    assert empty_tree.is_empty
+    assert not populated_tree.is_empty
+
+
+def test_len(empty_tree, populated_tree):
+    """Check __len__() counts stored values."""
+    assert len(empty_tree) == 0
+    assert len(populated_tree) == TREE_SIZE
+
+
+def test_height(empty_tree, populated_tree):
+    """Check the frozen tree is balanced."""
+    assert empty_tree.height() == 0
+    assert populated_tree.height() == TREE_HEIGHT
+
+
+# --- Tests: Layout ---
+def test_van_emde_boas_order():
+    """Check slots follow the recursive van Emde Boas layout."""
+    tree = FrozenBinarySearchTree.from_sorted(range(PERFECT_SIZE))
+    assert tree._values == EXPECTED_VEB_ORDER
+
+
+def test_freeze():
+    """Check BinarySearchTree.freeze() keeps every value."""
+    bst = BinarySearchTree()
+    for val in TEST_DATA_INPUT:
+        bst.insert(val)
+    frozen = bst.freeze()
+    assert list(frozen) == EXPECTED_INORDER
+    assert frozen.height() == TREE_HEIGHT
+
+
+# --- Tests: Search ---
+@pytest.mark.parametrize("size", [1, 2, 10, 100, 257])
+def test_search_sizes(size):
+    """Check every value is found and missing values are not."""
+    tree = FrozenBinarySearchTree.from_sorted(range(0, 2 * size, 2))
+    assert all(tree.search(val) for val in range(0, 2 * size, 2))
+    assert not any(tree.search(val) for val in range(-1, 2 * size, 2))
+    assert list(tree) == list(range(0, 2 * size, 2))
+
+
+def test_search_not_found(populated_tree, empty_tree):
+    """Check that search returns False for missing elements."""
+    assert not populated_tree.search(999)
+    assert 35 not in populated_tree
+    assert not empty_tree.search(50)
+
+
+def test_cached_search(populated_tree):
+    """Check memoized search agrees with search and reuses answers."""
+    search = populated_tree.cached_search(maxsize=2)
+    assert search(50)
+    assert search(50)
+    assert not search(35)
+    assert search.cache_info().hits == 1
+    search.cache_clear()
+    assert search.cache_info().currsize == 0
+
+    unbounded = populated_tree.cached_search(maxsize=None)
+    assert all(unbounded(val) for val in TEST_DATA_INPUT)
+
+
+# --- Tests: Traversal ---
+def test_inorder_traversal(populated_tree, empty_tree):
+    """Iteration should return values in sorted order."""
+    assert list(populated_tree) == EXPECTED_INORDER
+    assert list(empty_tree) == []
+
+
+def test_str(empty_tree, populated_tree):
+    """Verify __str__() returns correct string representation."""
+    assert str(empty_tree) == "FrozenBinarySearchTree([])"
+    assert str(populated_tree) == f"FrozenBinarySearchTree({EXPECTED_INORDER})"
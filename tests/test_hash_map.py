@@ -6,6 +6,7 @@ NUM_ELEMENTS = 10
 KEY_5 = 5
 KEY_10 = 10
 NEW_VALUE = 100
+GROWTH_KEYS = 100
 
 TEST_PAIRS = [
     (0, 0), (8, 8), (1, 1), (9, 9), (2, 2),
@@ -13,7 +14,7 @@ TEST_PAIRS = [
 ]
 
 # Set is used because HashMap order is not guaranteed
-SET_OF_TEST_PAIRS = set([f"{k}: {v}" for k, v in TEST_PAIRS])
+SET_OF_TEST_PAIRS = frozenset(f"{k}: {v}" for k, v in TEST_PAIRS)
 
 
 # --- Fixtures ---
@@ -39,6 +40,32 @@ def test_is_empty(empty_hash_map, populated_hash_map):
     assert not populated_hash_map.is_empty
 
 
+def test_slots(empty_hash_map):
+    """Ensure hash maps store their state in slots instead of a per-instance dict."""
+    assert not hasattr(empty_hash_map, "__dict__")
+
+
+# --- Tests: Capacity & Bucket Index ---
+@pytest.mark.parametrize("capacity,expected", [(1, 1), (5, 8), (8, 8), (9, 16)])
+def test_capacity_power_of_two(capacity, expected):
+    """Check capacity is rounded up to a power of two."""
+    assert HashMap(capacity)._capacity == expected
+
+
+def test_invalid_capacity():
+    """Check a map cannot be created without buckets."""
+    with pytest.raises(ValueError):
+        HashMap(0)
+
+
+def test_negative_keys(empty_hash_map):
+    """Check negative hashes still map to a valid bucket."""
+    empty_hash_map.put(-1, 1)
+    empty_hash_map.put(-9, 9)
+    assert empty_hash_map.get(-1) == 1
+    assert empty_hash_map.get(-9) == 9
+
+
 # --- Tests: Adding & Updating Keys ---
 def test_put_not_existing_key(populated_hash_map):
     """Check inserting a new key increases length and stores value."""
@@ -69,6 +96,38 @@ def test_put_collision(empty_hash_map):
     assert len(empty_hash_map) == 3
 
 
+def test_put_grows_capacity(empty_hash_map):
+    """Check the table doubles past the load factor and keeps every pair."""
+    for k in range(GROWTH_KEYS):
+        empty_hash_map.put(k, k)
+    assert len(empty_hash_map) == GROWTH_KEYS
+    assert empty_hash_map._capacity > GROWTH_KEYS
+    assert all(empty_hash_map.get(k) == k for k in range(GROWTH_KEYS))
+
+
+def test_remove_keeps_probe_chain(empty_hash_map):
+    """Check keys probed past a removed key stay reachable."""
+    for k in (0, 8, 16):
+        empty_hash_map.put(k, k)
+    assert empty_hash_map.remove(8)
+    assert empty_hash_map.get(16) == 16
+    assert 8 not in empty_hash_map
+
+    empty_hash_map.put(16, NEW_VALUE)
+    empty_hash_map.put(8, NEW_VALUE)
+    assert len(empty_hash_map) == 3
+    assert sorted(empty_hash_map.keys()) == [0, 8, 16]
+
+
+def test_remove_put_churn(empty_hash_map):
+    """Check repeated remove/put cycles do not fill the table with tombstones."""
+    for k in range(GROWTH_KEYS):
+        empty_hash_map.put(k, k)
+        assert empty_hash_map.remove(k)
+    assert empty_hash_map.is_empty
+    assert empty_hash_map.get(0) is None
+
+
 # --- Tests: Retrieving Values ---
 @pytest.mark.parametrize("key,value", TEST_PAIRS)
 def test_get_existing(populated_hash_map, key, value):
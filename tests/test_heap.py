@@ -59,6 +59,12 @@ def test_len(empty_max, empty_min, populated_max, populated_min):
     assert len(populated_min) == HEAP_SIZE
 
 
+def test_slots(empty_max, empty_min):
+    """Ensure heaps store their state in slots instead of a per-instance dict."""
+    assert not hasattr(empty_max, "__dict__")
+    assert not hasattr(empty_min, "__dict__")
+
+
 # --- Tests: Modification Methods ---
 def test_heapify_logic(empty_max, empty_min):
     """Verify heapify produces the correct internal structure."""
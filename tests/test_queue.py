@@ -29,6 +29,11 @@ def test_is_empty(empty_queue, populated_queue):
     assert not populated_queue.is_empty
 
 
+def test_slots(empty_queue):
+    """Ensure queues store their state in slots instead of a per-instance dict."""
+    assert not hasattr(empty_queue, "__dict__")
+
+
 # --- Tests: Adding Elements ---
 def test_enqueue(empty_queue):
     """Test enqueue() adds elements to the end of the queue."""
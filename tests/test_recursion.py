@@ -1,3 +1,4 @@
+import math
 import pytest
 from src.algorithms.recursion.recursion import (
     recursive_sum,
@@ -9,6 +10,11 @@ from src.algorithms.recursion.recursion import (
 )
 
 
+# --- Constants ---
+# Longer than the default recursion limit
+LARGE_SIZE = 5000
+
+
 # --- Tests: Recursive Sum ---
 @pytest.mark.parametrize("input_list, expected", [
     ([1, 2, 3, 4], 10),
@@ -21,6 +27,12 @@ def test_recursive_sum_basic(input_list, expected):
     assert recursive_sum(input_list) == expected
 
 
+def test_recursive_sum_large():
+    """Check long lists stay well within the recursion limit."""
+    assert recursive_sum(list(range(LARGE_SIZE))) == LARGE_SIZE * (LARGE_SIZE - 1) // 2
+    assert recursive_max(list(range(LARGE_SIZE))) == LARGE_SIZE - 1
+
+
 def test_recursive_sum_type_error():
     """Check that recursive_sum raises TypeError for non-numeric elements."""
     with pytest.raises(TypeError):
@@ -38,6 +50,12 @@ def test_recursive_max(input_list, expected):
     assert recursive_max(input_list) == expected
 
 
+def test_recursive_max_ties():
+    """Check recursive_max returns the last of equal maximum elements."""
+    assert type(recursive_max([1, 1.0])) is float
+    assert type(recursive_max([1.0, 3, 2, 3.0])) is float
+
+
 def test_recursive_max_value_error():
     """Check that recursive_max raises ValueError for an empty list."""
     with pytest.raises(ValueError):
@@ -62,6 +80,11 @@ def test_recursive_reverse(input_list, expected):
     assert recursive_reverse(input_list) == expected
 
 
+def test_recursive_reverse_large():
+    """Check long lists are reversed without hitting the recursion limit."""
+    assert recursive_reverse(list(range(LARGE_SIZE))) == list(range(LARGE_SIZE))[::-1]
+
+
 # --- Tests: Factorial ---
 @pytest.mark.parametrize("n, expected", [
     (0, 1),
@@ -82,6 +105,11 @@ def test_factorial_errors():
         factorial(5.5)
 
 
+def test_factorial_large():
+    """Check large inputs do not hit the recursion limit."""
+    assert factorial(1500) == math.factorial(1500)
+
+
 # --- Tests: Fibonacci ---
 @pytest.mark.parametrize("n, expected", [
     (0, 0),
@@ -94,6 +122,16 @@ def test_fibonacci(n, expected):
     assert fibonacci(n) == expected
 
 
+def test_fibonacci_large():
+    """Check large inputs run in linear time without hitting the recursion limit."""
+    assert fibonacci(90) == 2880067194370816120
+    assert fibonacci(91) == fibonacci(90) + fibonacci(89)
+
+    # Doubling identity: F(2k) = F(k) * (2 * F(k + 1) - F(k))
+    f_k, f_k1 = fibonacci(LARGE_SIZE // 2), fibonacci(LARGE_SIZE // 2 + 1)
+    assert fibonacci(LARGE_SIZE) == f_k * (2 * f_k1 - f_k)
+
+
 def test_fibonacci_errors():
     """Check fibonacci raises errors for negative numbers or floats."""
     with pytest.raises(ValueError):
@@ -0,0 +1,118 @@
+import math
+import pytest
+from src.data_structures.trees.scapegoat_tree import ScapegoatTree
+
+# --- Constants ---
+#  Tree Structure
+#        50
+#       /  \
+#     30    70
+#    /  \   /  \
+#   20  40 60  80
+
+TEST_DATA_INPUT = [50, 30, 20, 40, 70, 60, 80]
+
+EXPECTED_INORDER = [20, 30, 40, 50, 60, 70, 80]
+EXPECTED_PREORDER = [50, 30, 20, 40, 70, 60, 80]
+
+TREE_SIZE = 7
+TREE_HEIGHT = 3
+
+# Sorted input that would make a plain BST 2000 levels deep
+DEGENERATE_SIZE = 2000
+
+
+def max_height(size, alpha=0.7):
+    """Return the height a scapegoat tree of `size` nodes never exceeds."""
+    return math.floor(math.log(size) / math.log(1 / alpha)) + 1
+
+
+# --- Fixtures ---
+@pytest.fixture
+def empty_tree():
+    """Return an empty scapegoat tree."""
+    return ScapegoatTree()
+
+
+@pytest.fixture
+def populated_tree():
+    """Return a scapegoat tree populated with TEST_DATA_INPUT."""
+    tree = ScapegoatTree()
+    for val in TEST_DATA_INPUT:
+        tree.insert(val)
+    return tree
+
+
+# --- Tests: Basic Status ---
+def test_is_empty(empty_tree, populated_tree):
+    """Check is_empty() works correctly."""
+    assert empty_tree.is_empty
+    assert not populated_tree.is_empty
+
+
+def test_len(empty_tree, populated_tree):
+    """Check __len__() counts stored values."""
+    assert len(empty_tree) == 0
+    assert len(populated_tree) == TREE_SIZE
+
+
+def test_height(empty_tree, populated_tree):
+    """Check balanced input needs no rebuild."""
+    assert empty_tree.height() == 0
+    assert populated_tree.height() == TREE_HEIGHT
+    assert populated_tree.preorder() == EXPECTED_PREORDER
+
+
+@pytest.mark.parametrize("alpha", [0.49, 1.0])
+def test_invalid_alpha(alpha):
+    """Check alpha outside [0.5, 1) is rejected."""
+    with pytest.raises(ValueError):
+        ScapegoatTree(alpha)
+
+
+# --- Tests: Rebuilding ---
+@pytest.mark.parametrize(
+    "values",
+    [
+        range(DEGENERATE_SIZE),
+        range(DEGENERATE_SIZE, 0, -1),
+    ],
+)
+def test_insert_sorted_stays_balanced(empty_tree, values):
+    """Check sorted insertion keeps a logarithmic height."""
+    for val in values:
+        empty_tree.insert(val)
+    assert len(empty_tree) == DEGENERATE_SIZE
+    assert empty_tree.height() <= max_height(DEGENERATE_SIZE)
+    assert empty_tree.inorder() == sorted(values)
+
+
+def test_strict_alpha():
+    """Check alpha 0.5 keeps the tree as shallow as a perfect one."""
+    tree = ScapegoatTree(0.5)
+    tree.insert_many(range(DEGENERATE_SIZE))
+    assert tree.height() <= max_height(DEGENERATE_SIZE, 0.5)
+    assert list(tree) == list(range(DEGENERATE_SIZE))
+
+
+# --- Tests: Insert Logic ---
+def test_insert_duplicates(populated_tree):
+    """Check that inserting duplicates keeps size same."""
+    populated_tree.insert(50)
+    populated_tree.insert(20)
+    assert len(populated_tree) == TREE_SIZE
+
+
+def test_search(populated_tree, empty_tree):
+    """Check search is inherited from the plain BST."""
+    assert all(val in populated_tree for val in TEST_DATA_INPUT)
+    assert 35 not in populated_tree
+    assert 50 not in empty_tree
+
+
+def test_clear(populated_tree):
+    """Check clear() resets the tree."""
+    populated_tree.clear()
+    assert populated_tree.is_empty
+    assert populated_tree.height() == 0
+    assert list(populated_tree) == []
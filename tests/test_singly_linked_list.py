@@ -40,6 +40,11 @@ def test_is_empty(empty_list, populated_list):
     assert not populated_list.is_empty
 
 
+def test_slots(empty_list):
+    """Ensure lists store their state in slots instead of a per-instance dict."""
+    assert not hasattr(empty_list, "__dict__")
+
+
 # --- Tests: Adding Elements ---
 def test_append(empty_list):
     """Test append() adds elements to the end of the list."""
@@ -91,21 +96,29 @@ def test_insert_index_error(populated_list):
 # --- Tests: Removing Elements ---
 def test_delete(populated_list):
     """Test delete() removes elements and handles non-existing values."""
-    # Remove head
+    # Remove head, middle and tail
     assert populated_list.delete(TEST_DATA[0])
-    assert TEST_DATA[0] not in list(populated_list)
-
-    # Remove middle
     assert populated_list.delete(TEST_DATA[2])
-    assert TEST_DATA[2] not in list(populated_list)
-
-    # Remove tail
     assert populated_list.delete(TEST_DATA[-1])
-    assert TEST_DATA[-1] not in list(populated_list)
 
     # Attempt to remove non-existing value
     assert not populated_list.delete(NOT_EXISTING_VALUE)
 
+    # A single traversal checks every removal and the order of the rest
+    assert list(populated_list) == [TEST_DATA[1], TEST_DATA[3]]
+    assert len(populated_list) == NUM_ELEMENTS - 3
+
+
+def test_append_after_delete_tail(populated_list):
+    """Test append() links after the new tail once the old tail is deleted."""
+    assert populated_list.delete(TEST_DATA[-1])
+    populated_list.append(NEW_TAIL)
+    assert list(populated_list) == TEST_DATA[:-1] + [NEW_TAIL]
+
+    populated_list.clear()
+    populated_list.append(NEW_TAIL)
+    assert list(populated_list) == [NEW_TAIL]
+
 
 # --- Tests: Accessing Elements ---
 @pytest.mark.parametrize("index,expected", PARAM_DATA)
@@ -0,0 +1,119 @@
+import pytest
+from src.data_structures.linked_lists.skip_list import SkipList, MAX_LEVEL
+
+# --- Constants ---
+SEED = 42
+TEST_DATA_INPUT = [50, 30, 20, 40, 70, 60, 80]
+EXPECTED_ORDER = sorted(TEST_DATA_INPUT)
+LIST_SIZE = len(TEST_DATA_INPUT)
+NOT_EXISTING_VALUES = [0, 35, 999]
+NUM_SORTED_INSERTS = 2000
+
+
+# --- Fixtures ---
+@pytest.fixture
+def empty_list():
+    """Return an empty skip list."""
+    return SkipList(seed=SEED)
+
+
+@pytest.fixture
+def populated_list():
+    """Return a skip list populated with TEST_DATA_INPUT."""
+    sl = SkipList(seed=SEED)
+    for val in TEST_DATA_INPUT:
+        sl.insert(val)
+    return sl
+
+
+# --- Tests: Basic Status ---
+def test_is_empty(empty_list, populated_list):
+    """Check is_empty() for empty and populated lists."""
+    assert empty_list.is_empty
+    assert not populated_list.is_empty
+
+
+def test_len(empty_list, populated_list):
+    """Verify __len__() returns correct number of elements."""
+    assert len(empty_list) == 0
+    assert len(populated_list) == LIST_SIZE
+
+
+def test_height(empty_list, populated_list):
+    """Check height() stays within the level cap."""
+    assert empty_list.height() == 0
+    assert 1 <= populated_list.height() <= MAX_LEVEL
+
+
+# --- Tests: Search ---
+@pytest.mark.parametrize("value", TEST_DATA_INPUT)
+def test_search_found(populated_list, value):
+    """Check that search finds existing elements."""
+    assert populated_list.search(value)
+    assert value in populated_list
+
+
+@pytest.mark.parametrize("value", NOT_EXISTING_VALUES)
+def test_search_not_found(populated_list, empty_list, value):
+    """Check that search returns False for missing elements."""
+    assert not populated_list.search(value)
+    assert not empty_list.search(value)
+
+
+# --- Tests: Insert Logic ---
+def test_insert_duplicates(populated_list):
+    """Check that inserting duplicates keeps size same."""
+    populated_list.insert(50)
+    populated_list.insert(20)
+    assert len(populated_list) == LIST_SIZE
+    assert list(populated_list) == EXPECTED_ORDER
+
+
+def test_insert_sorted_input(empty_list):
+    """Check that sorted input keeps a logarithmic number of levels."""
+    for val in range(NUM_SORTED_INSERTS):
+        empty_list.insert(val)
+    assert list(empty_list) == list(range(NUM_SORTED_INSERTS))
+    assert empty_list.height() < NUM_SORTED_INSERTS.bit_length() * 3
+
+
+# --- Tests: Delete Logic ---
+def test_delete(populated_list):
+    """Test delete() removes elements and handles non-existing values."""
+    assert populated_list.delete(EXPECTED_ORDER[0])
+    assert populated_list.delete(EXPECTED_ORDER[3])
+    assert populated_list.delete(EXPECTED_ORDER[-1])
+    assert not populated_list.delete(NOT_EXISTING_VALUES[-1])
+
+    remaining = [v for i, v in enumerate(EXPECTED_ORDER) if i not in (0, 3, 6)]
+    assert list(populated_list) == remaining
+    assert len(populated_list) == LIST_SIZE - 3
+
+
+def test_delete_all(populated_list):
+    """Check that deleting every element resets the height."""
+    for val in TEST_DATA_INPUT:
+        assert populated_list.delete(val)
+    assert populated_list.is_empty
+    assert populated_list.height() == 0
+
+
+# --- Tests: Traversal & Clearing ---
+def test_iter(populated_list, empty_list):
+    """Iteration should yield values in ascending order."""
+    assert list(populated_list) == EXPECTED_ORDER
+    assert list(empty_list) == []
+
+
+def test_clear(populated_list):
+    """Check clear() empties the list and resets length."""
+    populated_list.clear()
+    assert list(populated_list) == []
+    assert len(populated_list) == 0
+    assert populated_list.height() == 0
+
+
+def test_str(empty_list, populated_list):
+    """Verify __str__() returns correct string representation."""
+    assert str(empty_list) == "SkipList([])"
+    assert str(populated_list) == f"SkipList({EXPECTED_ORDER})"
@@ -29,6 +29,14 @@ BASE_TEST_CASES = [
     ([4.5, 1.1, 3.8, 9.2, 7.0], [1.1, 3.8, 4.5, 7.0, 9.2]),
 ] + STRING_TEST_CASES
 
+# Sorted case-insensitively; equal keys keep their input order
+KEY_TEST_CASES = [
+    ([], []),
+    (["b", "A", "a", "B"], ["A", "a", "b", "B"]),
+    (["apple", "Apricot", "APPLE", "banana"], ["apple", "APPLE", "Apricot", "banana"]),
+    (["Dog", "cat", "dog", "Cat"], ["cat", "Cat", "Dog", "dog"]),
+]
+
 COUNTING_SORT_TEST_CASES = [
     ([], []),
     ([5], [5]),
@@ -87,6 +95,18 @@ def test_quick_sort(input_list, expected):
     run_sort_test(quick_sort, input_list, expected)
 
 
+@pytest.mark.parametrize(
+    "sort_func",
+    [bubble_sort, insertion_sort, selection_sort, merge_sort, quick_sort],
+)
+@pytest.mark.parametrize("input_list, expected", KEY_TEST_CASES)
+def test_sort_with_key(sort_func, input_list, expected):
+    """Tests that every comparison sort orders stably by a precomputed key."""
+    arr_copy = list(input_list)
+    sort_func(arr_copy, key=str.lower)
+    assert arr_copy == expected
+
+
 # --- Tests: Counting Sort (Non-Negative Integers only) ---
 @pytest.mark.parametrize("input_list, expected", COUNTING_SORT_TEST_CASES)
 def test_counting_sort(input_list, expected):
@@ -3,7 +3,12 @@ from src.data_structures.stacks.stack import Stack
 
 # --- Constants ---
 NUM_ELEMENTS = 5
-TEST_DATA = [n for n in range(NUM_ELEMENTS)]
+TEST_DATA = tuple(range(NUM_ELEMENTS))
+EMPTY_ERROR = "Stack is empty"
+EMPTY_STR = "Stack([])"
+POPULATED_STR = f"Stack({list(TEST_DATA)})"
+# Enough pushes to go through many list reallocations
+LARGE_SIZE = 100_000
 
 
 # --- Fixtures ---
@@ -14,10 +19,7 @@ def empty_stack():
 
 @pytest.fixture
 def populated_stack():
-    s = Stack()
-    for n in TEST_DATA:
-        s.push(n)
-    return s
+    return Stack.from_iterable(TEST_DATA)
 
 
 # --- Tests: Emptiness ---
@@ -27,6 +29,11 @@ def test_is_empty(empty_stack, populated_stack):
     assert not populated_stack.is_empty
 
 
+def test_slots(empty_stack):
+    """Ensure stacks store their state in slots instead of a per-instance dict."""
+    assert not hasattr(empty_stack, "__dict__")
+
+
 # --- Tests: Pushing Elements ---
 def test_push(empty_stack):
     """Test push() adds elements to the end of the stack."""
@@ -38,21 +45,48 @@ def test_push(empty_stack):
     assert len(empty_stack) == 3
 
 
+def test_extend(populated_stack):
+    """Test extend() pushes items in order on top of existing ones."""
+    populated_stack.extend(iter([10, 11]))
+
+    assert list(populated_stack) == [*TEST_DATA, 10, 11]
+    assert populated_stack.pop() == 11
+
+
+def test_from_iterable():
+    """Test from_iterable() builds a stack with the last item on top."""
+    stack = Stack.from_iterable(n for n in TEST_DATA)
+
+    assert list(stack) == list(TEST_DATA)
+    assert stack.peek() == TEST_DATA[-1]
+    assert Stack.from_iterable([]).is_empty
+
+
 # --- Tests: Popping Elements ---
 def test_pop(populated_stack):
     """Test pop() removes and returns elements from the end (LIFO)."""
-    assert populated_stack.pop() == TEST_DATA[-1]
-    assert populated_stack.pop() == TEST_DATA[-2]
-    assert populated_stack.pop() == TEST_DATA[-3]
+    popped = [populated_stack.pop() for _ in range(3)]
+    assert popped == list(reversed(TEST_DATA[-3:]))
     assert len(populated_stack) == NUM_ELEMENTS - 3
 
 
 def test_pop_index_error(empty_stack):
     """Test pop() raises IndexError when the stack is empty."""
-    with pytest.raises(IndexError):
+    with pytest.raises(IndexError, match=EMPTY_ERROR):
         empty_stack.pop()
 
 
+def test_push_pop_large(empty_stack):
+    """Check a large stack pops every pushed element in LIFO order."""
+    for n in range(LARGE_SIZE):
+        empty_stack.push(n)
+    assert len(empty_stack) == LARGE_SIZE
+
+    popped = [empty_stack.pop() for _ in range(LARGE_SIZE)]
+    assert popped == list(range(LARGE_SIZE - 1, -1, -1))
+    assert empty_stack.is_empty
+
+
 # --- Tests: Accessing Elements ---
 def test_peek(populated_stack):
     """Test peek() returns the last element without removing it."""
@@ -63,7 +97,7 @@ def test_peek(populated_stack):
 
 def test_peek_index_error(empty_stack):
     """Test peek() raises IndexError when the stack is empty."""
-    with pytest.raises(IndexError):
+    with pytest.raises(IndexError, match=EMPTY_ERROR):
         empty_stack.peek()
 
 
@@ -104,5 +138,5 @@ def test_len(empty_stack, populated_stack):
 
 def test_str(empty_stack, populated_stack):
     """Check __str__ returns correct string representation of the stack."""
-    assert str(empty_stack) == "Stack([])"
-    assert str(populated_stack) == f"Stack({TEST_DATA})"
+    assert str(empty_stack) == EMPTY_STR
+    assert str(populated_stack) == POPULATED_STR
@@ -0,0 +1,103 @@
+import pytest
+from src.data_structures.heaps.tournament_tree import TournamentTree, k_way_merge
+
+# --- Constants ---
+TEST_DATA_INPUT = [12, -3, 7, 25, -10, 0]
+NUM_SLOTS = len(TEST_DATA_INPUT)
+NEW_VALUE = -99
+
+SORTED_SOURCES = [[1, 4, 9], [2, 3, 10, 11], [], [0, 5], [6, 7, 8]]
+MERGED_EXPECTED = sorted(v for source in SORTED_SOURCES for v in source)
+
+
+# --- Fixtures ---
+@pytest.fixture
+def empty_tree():
+    """Return a tournament tree with every slot empty."""
+    return TournamentTree(NUM_SLOTS)
+
+
+@pytest.fixture
+def populated_tree():
+    """Return a tournament tree with TEST_DATA_INPUT loaded into its slots."""
+    tt = TournamentTree(NUM_SLOTS)
+    for i, val in enumerate(TEST_DATA_INPUT):
+        tt.replace(i, val)
+    return tt
+
+
+# --- Tests: Status & Utility ---
+def test_is_empty(empty_tree, populated_tree):
+    """Check is_empty() for empty and populated trees."""
+    assert empty_tree.is_empty
+    assert not populated_tree.is_empty
+
+
+def test_len(empty_tree, populated_tree):
+    """Verify __len__() counts only the occupied slots."""
+    assert len(empty_tree) == 0
+    assert len(populated_tree) == NUM_SLOTS
+    assert empty_tree.capacity == populated_tree.capacity == NUM_SLOTS
+
+
+def test_invalid_capacity():
+    """Verify a tree cannot be created without slots."""
+    with pytest.raises(ValueError):
+        TournamentTree(0)
+
+
+# --- Tests: Access Methods ---
+def test_winner(populated_tree):
+    """Verify the root points to the slot with the smallest value."""
+    expected = TEST_DATA_INPUT.index(min(TEST_DATA_INPUT))
+    assert populated_tree.winner() == expected
+    assert populated_tree.peek() == min(TEST_DATA_INPUT)
+
+
+def test_empty_raises(empty_tree):
+    """Verify winner() and peek() raise IndexError when every slot is empty."""
+    with pytest.raises(IndexError):
+        empty_tree.winner()
+    with pytest.raises(IndexError):
+        empty_tree.peek()
+
+
+# --- Tests: Modification Methods ---
+def test_replace(populated_tree):
+    """Test replace() updates the winner in both directions."""
+    populated_tree.replace(0, NEW_VALUE)
+    assert populated_tree.winner() == 0
+    assert populated_tree.peek() == NEW_VALUE
+
+    populated_tree.replace(0, max(TEST_DATA_INPUT) + 1)
+    assert populated_tree.peek() == min(TEST_DATA_INPUT)
+
+
+def test_remove(populated_tree):
+    """Test remove() drains slots in ascending order of their values."""
+    drained = []
+    while not populated_tree.is_empty:
+        drained.append(populated_tree.peek())
+        populated_tree.remove(populated_tree.winner())
+    assert drained == sorted(TEST_DATA_INPUT)
+    assert len(populated_tree) == 0
+
+
+def test_index_error(populated_tree):
+    """Verify replace() and remove() raise IndexError for invalid slots."""
+    with pytest.raises(IndexError):
+        populated_tree.replace(NUM_SLOTS, NEW_VALUE)
+    with pytest.raises(IndexError):
+        populated_tree.remove(-1)
+
+
+# --- Tests: K-Way Merge ---
+@pytest.mark.parametrize("sources, expected", [
+    (SORTED_SOURCES, MERGED_EXPECTED),
+    ([[3, 5, 7]], [3, 5, 7]),
+    ([[], []], []),
+    ([], []),
+])
+def test_k_way_merge(sources, expected):
+    """Test k_way_merge() combines sorted inputs into one sorted list."""
+    assert k_way_merge(sources) == expected